@@ -20,16 +20,24 @@ class NASAHTTPRepository(NASARepository):
     This class makes actual HTTP calls to the NASA API using httpx.
     """
     
-    def __init__(self, base_url: str = "https://api.nasa.gov", api_key: str = ""):
+    def __init__(
+        self,
+        base_url: str = "https://api.nasa.gov",
+        api_key: str = "",
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
         """
         Initialize HTTP repository.
         
         Args:
             base_url: Base URL of the NASA API
             api_key: NASA API key
+            transport: Optional httpx transport for the HTTP client
+                (e.g. httpx.MockTransport in tests); defaults to the network
         """
         self.base_url = base_url
         self.api_key = api_key
+        self.transport = transport
     
     async def get_apod(self, date: Optional[str] = None, hd: bool = False) -> APOD:
         """
@@ -53,7 +61,7 @@ class NASAHTTPRepository(NASARepository):
         if hd:
             params["hd"] = True
         
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=self.transport) as client:
             response = await client.get(
                 f"{self.base_url}/planetary/apod",
                 params=params
@@ -94,7 +102,7 @@ class NASAHTTPRepository(NASARepository):
         if detailed:
             params["detailed"] = True
         
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=self.transport) as client:
             response = await client.get(
                 f"{self.base_url}/neo/rest/v1/feed",
                 params=params
@@ -135,7 +143,7 @@ class NASAHTTPRepository(NASARepository):
         if notification_type:
             params["type"] = notification_type
         
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=self.transport) as client:
             response = await client.get(
                 f"{self.base_url}/DONKI/notifications",
                 params=params
@@ -169,7 +177,7 @@ class NASAHTTPRepository(NASARepository):
             "ver": ver
         }
         
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=self.transport) as client:
             response = await client.get(
                 f"{self.base_url}/insight_weather/",
                 params=params
@@ -205,7 +213,7 @@ class NASAHTTPRepository(NASARepository):
         if query:
             params["query"] = query
         
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=self.transport) as client:
             response = await client.get(
                 f"{self.base_url}/techtransfer/patent/",
                 params=params
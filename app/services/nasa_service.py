@@ -9,16 +9,24 @@ from app.schemas.nasa import APOD
 class NASAService:
     """Service for interacting with external NASA API"""
     
-    def __init__(self, base_url: str = "https://api.nasa.gov", api_key: str = ""):
+    def __init__(
+        self,
+        base_url: str = "https://api.nasa.gov",
+        api_key: str = "",
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
         """
         Initialize NASA service.
         
         Args:
             base_url: Base URL of the NASA API
             api_key: NASA API key
+            transport: Optional httpx transport for the HTTP client
+                (e.g. httpx.MockTransport in tests); defaults to the network
         """
         self.base_url = base_url
         self.api_key = api_key
+        self.transport = transport
         self.apod_endpoint = f"{base_url}/planetary/apod"
     
     async def get_apod(self, date: Optional[str] = None, hd: bool = False) -> APOD:
@@ -45,7 +53,7 @@ class NASAService:
         if hd:
             params["hd"] = True
         
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=self.transport) as client:
             response = await client.get(self.apod_endpoint, params=params)
             response.raise_for_status()
             data = response.json()
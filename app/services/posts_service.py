@@ -9,15 +9,22 @@ from app.schemas.post import Post, PostCreate, PostUpdate
 class PostsService:
     """Service for interacting with external Posts API"""
     
-    def __init__(self, base_url: str = "https://jsonplaceholder.typicode.com"):
+    def __init__(
+        self,
+        base_url: str = "https://jsonplaceholder.typicode.com",
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
         """
         Initialize Posts service.
         
         Args:
             base_url: Base URL of the external Posts API
+            transport: Optional httpx transport for the HTTP client
+                (e.g. httpx.MockTransport in tests); defaults to the network
         """
         self.base_url = base_url
         self.posts_endpoint = f"{base_url}/posts"
+        self.transport = transport
     
     async def get_all_posts(self) -> List[Post]:
         """
@@ -29,7 +36,7 @@ class PostsService:
         Raises:
             httpx.HTTPError: If API request fails
         """
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=self.transport) as client:
             response = await client.get(self.posts_endpoint)
             response.raise_for_status()
             data = response.json()
@@ -50,7 +57,7 @@ class PostsService:
         Raises:
             httpx.HTTPStatusError: If post not found (404) or other HTTP error
         """
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=self.transport) as client:
             response = await client.get(f"{self.posts_endpoint}/{post_id}")
             response.raise_for_status()
             data = response.json()
@@ -70,7 +77,7 @@ class PostsService:
         Raises:
             httpx.HTTPError: If API request fails
         """
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=self.transport) as client:
             response = await client.post(
                 self.posts_endpoint,
                 json=post_data.model_dump()
@@ -94,7 +101,7 @@ class PostsService:
         Raises:
             httpx.HTTPStatusError: If post not found (404) or other HTTP error
         """
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=self.transport) as client:
             # Only include non-None fields in the update
             update_payload = post_data.model_dump(exclude_none=True)
             
@@ -117,7 +124,7 @@ class PostsService:
         Raises:
             httpx.HTTPStatusError: If post not found (404) or other HTTP error
         """
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=self.transport) as client:
             response = await client.delete(f"{self.posts_endpoint}/{post_id}")
             response.raise_for_status()
 
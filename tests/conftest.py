@@ -3,10 +3,21 @@ Global pytest configuration
 General test configuration and shared fixtures.
 Database-related fixtures are encapsulated in infrastructure/db/fixtures.py
 """
+import asyncio
+import sys
 import pytest
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient
+from app.database.connection import get_db
 from app.main import app
 
+# Run async tests on uvloop where available (not supported on Windows).
+# pytest-asyncio 0.21 creates every event_loop from the current policy, so
+# setting it here covers the default and the module-scoped loops alike.
+if sys.platform != "win32":
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 # Register database fixtures module so pytest can discover the fixtures
 pytest_plugins = [
     "tests.infrastructure.db.fixtures",
@@ -14,8 +25,22 @@ pytest_plugins = [
 ]
 
 
+@pytest.fixture(scope="session")
+def transport() -> ASGITransport:
+    """
+    ASGI transport wrapping the app, built once and shared by every client.
+    
+    The transport holds no connection state, so reusing it across tests is
+    safe; dependency overrides are read from the app on each request.
+    
+    Returns:
+        ASGITransport: In-process transport for the FastAPI app
+    """
+    return ASGITransport(app=app)
+
+
 @pytest.fixture
-async def client(db_session):
+async def client(db_session, transport: ASGITransport):
     """
     Async HTTP client for tests with database dependency override.
     
@@ -24,19 +49,18 @@ async def client(db_session):
     
     Args:
         db_session: Database session fixture from infrastructure/db
+        transport: Shared ASGI transport from session-scoped fixture
         
     Yields:
         AsyncClient: HTTP client configured for testing
     """
-    from app.database.connection import get_db
-    
     def override_get_db():
         """Override get_db to use test session"""
         yield db_session
     
     app.dependency_overrides[get_db] = override_get_db
     
-    async with AsyncClient(app=app, base_url="http://test") as ac:
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
     
     # Clean up override after test
@@ -25,6 +25,9 @@ class TestSettings(BaseSettings):
     
     # Database backend selection
     TEST_DB_BACKEND: str
+    # Optional database URL; when set, Testcontainers is skipped
+    # Example: TEST_DB_URL="sqlite:///:memory:"
+    TEST_DB_URL: Optional[str] = None
     
     # Database credentials (required, no defaults)
     TEST_DB_USER: str
@@ -1,6 +1,6 @@
 # Database infrastructure
 # Export fixtures for use in conftest.py
-from tests.infrastructure.db.fixtures import db_engine, db_session
+from tests.infrastructure.db.fixtures import db_engine, db_connection, db_session
 
-__all__ = ["db_engine", "db_session"]
+__all__ = ["db_engine", "db_connection", "db_session"]
 
@@ -0,0 +1,87 @@
+"""
+URL backend for tests: build the test engine from TEST_DB_URL.
+Skips Testcontainers entirely, e.g. to run the suite on in-memory SQLite
+or against an already running database in CI.
+
+Features:
+- sqlite:///:memory: uses StaticPool so every session shares the same
+  in-memory database (each new connection would otherwise get an empty one)
+- SQLite engines are patched so SAVEPOINTs work with the pysqlite driver,
+  which the per-test SAVEPOINT rollback in db_session relies on
+- Any other URL gets a per-worker database under pytest-xdist
+
+Notes:
+- The SQL migration files use Postgres syntax (SERIAL, NOW()); with SQLite
+  use the SQLAlchemy schema strategy instead, e.g.
+  SQLALCHEMY_SCHEMA_MODULE=app.database.models
+"""
+from __future__ import annotations
+
+from typing import Optional
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, Engine
+from sqlalchemy.engine.url import make_url
+from sqlalchemy.pool import StaticPool
+
+from .worker_db import create_worker_database, drop_worker_database
+
+_engine: Optional[Engine] = None
+_base_url: Optional[URL] = None
+_worker_url: Optional[URL] = None
+
+
+def _enable_sqlite_savepoints(engine: Engine) -> None:
+    """
+    Let SQLAlchemy emit BEGIN itself so SAVEPOINT / RELEASE work on pysqlite.
+
+    The pysqlite driver manages transactions on its own and breaks
+    SAVEPOINT handling; this is the recipe from the SQLAlchemy SQLite docs.
+    """
+    @event.listens_for(engine, "connect")
+    def do_connect(dbapi_connection, connection_record):
+        # Disable pysqlite's own BEGIN emission
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+
+def get_url_engine(url: str) -> Engine:
+    """
+    Get or create an engine for the given database URL.
+
+    Args:
+        url: SQLAlchemy database URL (e.g. "sqlite:///:memory:")
+
+    Returns:
+        SQLAlchemy Engine shared by the whole test session
+    """
+    global _engine, _base_url, _worker_url
+    if _engine is not None:
+        return _engine
+
+    if make_url(url).get_backend_name() == "sqlite":
+        # In-memory SQLite is already private to each worker process
+        _engine = create_engine(
+            url,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        _enable_sqlite_savepoints(_engine)
+    else:
+        _base_url = make_url(url)
+        _worker_url = create_worker_database(_base_url)
+        _engine = create_engine(_worker_url)
+    return _engine
+
+
+def dispose_url_engine() -> None:
+    """Dispose the URL engine and drop the worker database (called at end of test session)."""
+    global _engine, _base_url, _worker_url
+    if _engine is not None:
+        _engine.dispose()
+        _engine = None
+    if _base_url is not None and _worker_url is not None:
+        drop_worker_database(_base_url, _worker_url)
+        _base_url = _worker_url = None
@@ -0,0 +1,69 @@
+"""
+Per-worker databases for parallel runs with pytest-xdist (`pytest -n auto`).
+
+Each xdist worker gets its own database (e.g. "test_gw0", "test_gw1") on the
+same server, so workers never see each other's rows and each one keeps its
+own engine and SAVEPOINT rollback stack. Without xdist the URL is used as-is.
+"""
+from __future__ import annotations
+
+import os
+from typing import Any, Dict, Optional
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import URL
+
+
+def get_worker_id() -> Optional[str]:
+    """Return the xdist worker id (e.g. "gw0"), or None when not running under xdist."""
+    return os.environ.get("PYTEST_XDIST_WORKER")
+
+
+def _admin_execute(url: URL, statement: str, params: Optional[Dict[str, Any]] = None) -> None:
+    """Run a statement outside a transaction (CREATE/DROP DATABASE need it)."""
+    admin_engine = create_engine(url, isolation_level="AUTOCOMMIT")
+    try:
+        with admin_engine.connect() as conn:
+            conn.execute(text(statement), params or {})
+    finally:
+        admin_engine.dispose()
+
+
+def create_worker_database(url: URL) -> URL:
+    """
+    Create a fresh database for the current xdist worker.
+
+    Args:
+        url: URL of the base test database; used to reach the server
+
+    Returns:
+        URL pointing to the worker database, or the original URL without xdist
+    """
+    worker_id = get_worker_id()
+    if worker_id is None:
+        return url
+
+    worker_database = f"{url.database}_{worker_id}"
+    _admin_execute(url, f'DROP DATABASE IF EXISTS "{worker_database}"')
+    _admin_execute(url, f'CREATE DATABASE "{worker_database}"')
+    return url.set(database=worker_database)
+
+
+def drop_worker_database(url: URL, worker_url: URL) -> None:
+    """
+    Drop the worker database created by create_worker_database.
+
+    Args:
+        url: URL of the base test database (the connection runs from there)
+        worker_url: URL returned by create_worker_database
+    """
+    if worker_url.database == url.database:
+        return
+    # Close leftover connections first; DROP DATABASE ... WITH (FORCE) would
+    # do the same but needs PostgreSQL 13+
+    _admin_execute(
+        url,
+        "SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+        "WHERE datname = :database AND pid <> pg_backend_pid()",
+        {"database": worker_url.database},
+    )
+    _admin_execute(url, f'DROP DATABASE IF EXISTS "{worker_url.database}"')
@@ -2,15 +2,20 @@
 Database fixtures for tests.
 Encapsulated fixtures for database testing with testcontainers.
 """
+import shutil
+import tempfile
+from pathlib import Path
+
 import pytest
-from sqlalchemy import text
-from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.engine import Connection, Engine
 
 from tests.infrastructure.config.settings_test import test_settings
 from tests.infrastructure.db.manager import (
     create_engine_and_schema,
     shutdown_backends,
+    serve_shared_backend,
+    use_shared_backend,
     SchemaStrategy,
 )
 from tests.infrastructure.db.schema_builders.sqlalchemy_builder import sqlalchemy_strategy
@@ -41,6 +46,55 @@ def _resolve_schema_strategy() -> SchemaStrategy:
     return sql_files_strategy("tests/infrastructure/db/migrations/sql")
 
 
+_HANDOFF_DIR_KEY = pytest.StashKey[Path]()
+
+
+def _is_xdist_controller(config: pytest.Config) -> bool:
+    """True in the process that hands out tests to xdist workers."""
+    return (
+        not hasattr(config, "workerinput")
+        and config.getoption("dist", "no") != "no"
+        and not config.getoption("collectonly")
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Serve the test database from the xdist controller, or request it in a worker.
+    
+    The controller starts the container only when the first worker's
+    db_engine asks for it, so runs without database tests (e.g. -m "not
+    integration" or unit files only) never need Docker. Workers never start
+    or stop the container: they only create and drop their own database in
+    it. Without xdist db_engine starts it lazily.
+    """
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is not None:
+        if workerinput.get("test_db_handoff_dir"):
+            use_shared_backend(Path(workerinput["test_db_handoff_dir"]))
+    elif _is_xdist_controller(config):
+        handoff_dir = Path(tempfile.mkdtemp(prefix="test-db-"))
+        config.stash[_HANDOFF_DIR_KEY] = handoff_dir
+        serve_shared_backend(handoff_dir)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node) -> None:
+    """Pass the controller's handoff directory to each xdist worker."""
+    handoff_dir = node.config.stash.get(_HANDOFF_DIR_KEY, None)
+    if handoff_dir is not None:
+        node.workerinput["test_db_handoff_dir"] = str(handoff_dir)
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Stop the container in the xdist controller once every worker is done."""
+    if _is_xdist_controller(config):
+        shutdown_backends()
+        handoff_dir = config.stash.get(_HANDOFF_DIR_KEY, None)
+        if handoff_dir is not None:
+            shutil.rmtree(handoff_dir, ignore_errors=True)
+
+
 @pytest.fixture(scope="session")
 def db_engine() -> Engine:
     """
@@ -62,39 +116,62 @@ def db_engine() -> Engine:
     shutdown_backends()
 
 
+@pytest.fixture(scope="session")
+def db_connection(db_engine: Engine) -> Connection:
+    """
+    Open one connection with an outer transaction for the whole session.
+    
+    Tests never commit to the database for real: every db_session joins
+    this transaction through a SAVEPOINT, and the outer transaction is
+    rolled back once at the end of the session.
+    
+    Args:
+        db_engine: Database engine from session-scoped fixture
+        
+    Yields:
+        SQLAlchemy Connection shared by all test sessions
+    """
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    try:
+        yield connection
+    finally:
+        transaction.rollback()
+        connection.close()
+
+
 @pytest.fixture()
-def db_session(db_engine: Engine) -> Session:
+def db_session(db_connection: Connection) -> Session:
     """
-    Provide a SQLAlchemy session per test with transaction scope.
+    Provide a SQLAlchemy session per test with SAVEPOINT scope.
     
-    Each test runs in a transaction that is rolled back after the test,
-    ensuring test isolation. This fixture:
-    - Creates a new session for each test
-    - Provides transactional isolation
-    - Rolls back all changes after test execution
-    - Truncates tables to ensure clean state
+    The session is joined into the session-wide outer transaction
+    ("join a session into an external transaction" recipe). This fixture:
+    - Opens a SAVEPOINT for each test
+    - Binds a session with join_transaction_mode="create_savepoint", so
+      session.commit() / session.rollback() inside the test only release
+      or roll back nested SAVEPOINTs and never persist data
+    - Rolls back the test SAVEPOINT on teardown, leaving tables clean
+      without a TRUNCATE per test
     - Closes session properly
     
     Args:
-        db_engine: Database engine from session-scoped fixture
+        db_connection: Connection with the outer transaction from session-scoped fixture
         
     Yields:
         SQLAlchemy Session object for the test
     """
-    SessionLocal = sessionmaker(bind=db_engine, autoflush=False, autocommit=False)
-    session = SessionLocal()
+    savepoint = db_connection.begin_nested()
+    session = Session(
+        bind=db_connection,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+    )
     
     try:
         yield session
-        # Rollback at the end to ensure test isolation
-        session.rollback()
     finally:
-        # Clean up any remaining data
-        try:
-            session.execute(text("TRUNCATE TABLE users RESTART IDENTITY CASCADE"))
-            session.commit()
-        except Exception:
-            session.rollback()
-        finally:
-            session.close()
-
+        session.close()
+        # Discard everything the test wrote
+        if savepoint.is_active:
+            savepoint.rollback()
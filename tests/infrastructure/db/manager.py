@@ -15,7 +15,15 @@ from sqlalchemy import text
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
-from .dialects.postgres_testcontainers import get_postgres_engine, stop_postgres_container
+from tests.infrastructure.config.settings_test import test_settings
+
+from .dialects.postgres_testcontainers import (
+    get_postgres_engine,
+    serve_shared_container,
+    stop_postgres_container,
+    use_shared_container,
+)
+from .dialects.url_engine import dispose_url_engine, get_url_engine
 
 
 @dataclass
@@ -63,6 +71,12 @@ def apply_schema(engine: Engine, strategy: SchemaStrategy) -> None:
     if stype == "sql_files":
         if not strategy.sql_dir:
             raise ValueError("sql_files strategy requires 'sql_dir'")
+        if engine.dialect.name == "sqlite":
+            # The SQL migrations use Postgres syntax (SERIAL, NOW())
+            raise ValueError(
+                "sql_files strategy can't build a SQLite schema; with a sqlite TEST_DB_URL "
+                "set SQLALCHEMY_SCHEMA_MODULE=app.database.models in tests/.env.test"
+            )
         _execute_sql_files(engine, Path(strategy.sql_dir))
         return
     raise ValueError(f"Unknown schema strategy: {strategy.type}")
@@ -73,17 +87,47 @@ def run_seed_sql(engine: Engine, seeds_dir: str) -> None:
     _execute_sql_files(engine, Path(seeds_dir))
 
 
+def get_test_engine() -> Engine:
+    """
+    Return the engine for the configured backend.
+    TEST_DB_URL (e.g. sqlite:///:memory:) takes precedence over Testcontainers.
+    """
+    if test_settings.TEST_DB_URL:
+        return get_url_engine(test_settings.TEST_DB_URL)
+    return get_postgres_engine()
+
+
+def serve_shared_backend(handoff_dir: Path) -> None:
+    """
+    Let xdist workers ask the controller for the Testcontainers Postgres.
+    The container only starts on the first request; no-op with TEST_DB_URL.
+    """
+    if test_settings.TEST_DB_URL:
+        return
+    serve_shared_container(handoff_dir)
+
+
+def use_shared_backend(handoff_dir: Path) -> None:
+    """Make this xdist worker request the container from the controller."""
+    use_shared_container(handoff_dir)
+
+
 def create_engine_and_schema(strategy: SchemaStrategy, seeds_dir: Optional[str] = None) -> Engine:
     """
-    Create a Postgres engine via Testcontainers and build schema/seeds.
+    Create the test engine (Testcontainers Postgres or TEST_DB_URL) and build schema/seeds.
     Returns an SQLAlchemy Engine.
+    
+    seeds_dir always runs when it exists. Otherwise the default seeds in
+    tests/infrastructure/db/seed run only with the sql_files strategy,
+    since they insert into tables created by the SQL migrations.
     """
-    engine = get_postgres_engine()
+    engine = get_test_engine()
     apply_schema(engine, strategy)
     # Run seeds if provided or if default directory exists
     if seeds_dir and Path(seeds_dir).exists():
         run_seed_sql(engine, seeds_dir)
-    else:
+    elif strategy.type.lower() == "sql_files":
+        # Default seeds populate the tables created by the SQL migrations
         default_seeds = Path("tests/infrastructure/db/seed")
         if default_seeds.exists():
             run_seed_sql(engine, str(default_seeds))
@@ -110,7 +154,8 @@ def session_scope(engine: Engine):
 
 
 def shutdown_backends() -> None:
-    """Shutdown any running containers (called at end of test session)."""
+    """Shutdown any running containers and engines (called at end of test session)."""
+    dispose_url_engine()
     stop_postgres_container()
 
 
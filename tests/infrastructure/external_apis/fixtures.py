@@ -9,6 +9,30 @@ from pathlib import Path
 from typing import Generator
 
 from .server import MockAPIServer
+from .posts.mock import PostsMock
+from .nasa.mock import NASAMock
+
+
+@pytest.fixture(scope="session")
+def posts_mock() -> PostsMock:
+    """
+    Session-scoped PostsMock for loading Posts API assets in tests.
+    
+    PostsMock caches parsed payloads and returns copies, so one instance
+    can be shared by every test without leaking mutations between them.
+    """
+    return PostsMock()
+
+
+@pytest.fixture(scope="session")
+def nasa_mock() -> NASAMock:
+    """
+    Session-scoped NASAMock for loading NASA API payloads in tests.
+    
+    NASAMock caches parsed payloads and returns copies, so one instance
+    can be shared by every test without leaking mutations between them.
+    """
+    return NASAMock()
 
 
 @pytest.fixture(scope="function")
@@ -44,7 +68,8 @@ def posts_mock_server_session() -> Generator[MockAPIServer, None, None]:
     The server is started once per test session and reused across tests.
     Use this for better performance when running many tests.
     
-    Note: State is reset between tests using server.reset_state()
+    Note: State is not reset between tests; use posts_mock_server_shared
+    (or call server.reset_state()) when tests change server state.
     """
     spec_path = Path(__file__).parent / "posts" / "openapi.yaml"
     server = MockAPIServer("posts", spec_path, port=0)
@@ -56,6 +81,28 @@ def posts_mock_server_session() -> Generator[MockAPIServer, None, None]:
         server.stop()
 
 
+@pytest.fixture(scope="function")
+def posts_mock_server_shared(
+    posts_mock_server_session: MockAPIServer,
+) -> Generator[MockAPIServer, None, None]:
+    """
+    Session-scoped Posts API mock server with per-test state reset.
+    
+    Boots the server once per session (once per xdist worker) like
+    posts_mock_server_session, but clears server state (e.g. deleted posts)
+    after each test, so tests behave as with the function-scoped
+    posts_mock_server.
+    
+    Args:
+        posts_mock_server_session: Session-scoped Posts API mock server
+    
+    Yields:
+        The shared MockAPIServer
+    """
+    yield posts_mock_server_session
+    posts_mock_server_session.reset_state()
+
+
 @pytest.fixture(scope="function")
 def nasa_mock_server() -> Generator[MockAPIServer, None, None]:
     """
@@ -3,9 +3,9 @@ Mock for NASA API provider for tests.
 Loads payloads based on OpenAPI specification mapping.
 """
 from typing import Dict, Any, List, Optional
-import json
 from pathlib import Path
 
+from ..payload_loader import load_json_payload
 from .spec_loader import OpenAPISpecLoader
 
 
@@ -29,6 +29,9 @@ class NASAMock:
         """
         Load JSON file from path.
         
+        Files are parsed once per process and cached; callers get a deep
+        copy, so tests can't mutate the shared parsed payloads.
+        
         Args:
             file_path: Path to JSON file
             
@@ -38,10 +41,7 @@ class NASAMock:
         Raises:
             FileNotFoundError: If the file doesn't exist
         """
-        if not file_path.exists():
-            raise FileNotFoundError(f"Payload file not found: {file_path}")
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return load_json_payload(file_path)
     
     def _get_payload(self, method: str, path: str, status_code: str = "200") -> Optional[Dict[str, Any]]:
         """
@@ -0,0 +1,49 @@
+"""
+JSON payload loading shared by the external API mocks.
+
+Payload files are parsed once per process (each xdist worker pays it once)
+and every caller gets a deep copy, so tests can't mutate the cached data.
+"""
+from typing import Any
+import copy
+import functools
+from pathlib import Path
+
+import orjson
+
+
+@functools.cache
+def _parse_json_file(file_path: Path) -> Any:
+    """
+    Read and parse a payload file once per process.
+    
+    The result is shared and must not be mutated; use load_json_payload.
+    
+    Args:
+        file_path: Path to JSON file
+        
+    Returns:
+        Parsed JSON content
+        
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    if not file_path.exists():
+        raise FileNotFoundError(f"Payload file not found: {file_path}")
+    return orjson.loads(file_path.read_bytes())
+
+
+def load_json_payload(file_path: Path) -> Any:
+    """
+    Load a JSON payload file as a private copy of the cached parse.
+    
+    Args:
+        file_path: Path to JSON file
+        
+    Returns:
+        Parsed JSON content, safe for the caller to mutate
+        
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    return copy.deepcopy(_parse_json_file(file_path))
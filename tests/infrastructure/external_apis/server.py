@@ -1,19 +1,23 @@
 """
 Mock HTTP Server for External APIs.
 
-This module provides a FastAPI-based mock server that serves API responses
+This module provides a Starlette-based mock server that serves API responses
 based on OpenAPI specifications and payload files. The server can be started
 programmatically for testing purposes.
 """
 from __future__ import annotations
 
-import json
 import re
 import socket
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Optional, List
-from fastapi import FastAPI, Request, Response, HTTPException
-from fastapi.responses import JSONResponse
+from typing import Any, Dict, Optional, List, Tuple
+from starlette.applications import Starlette
+from starlette.exceptions import HTTPException
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+import orjson
 import uvicorn
 from threading import Thread
 import time
@@ -23,6 +27,35 @@ import importlib.util
 import sys
 
 
+async def _http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+    """Keep FastAPI's JSON error body for unmatched paths and methods."""
+    return JSONResponse(
+        content={"detail": exc.detail},
+        status_code=exc.status_code,
+        headers=exc.headers
+    )
+
+
+@dataclass
+class RouteEntry:
+    """
+    Precomputed data for one (method, path) operation of the OpenAPI spec.
+    
+    prebuilt_response_bytes is only set for static payloads (no path params,
+    no request-body merging), which can be served as-is on every request.
+    read_entry points to the GET operation of the same path (used by DELETE
+    to check existence) and payload_cache memoizes payload lookups per
+    (status_code, path params).
+    """
+    method: str
+    spec_path: str
+    operation: Dict[str, Any]
+    status_code: int
+    prebuilt_response_bytes: Optional[bytes] = None
+    read_entry: Optional[RouteEntry] = None
+    payload_cache: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], Any] = field(default_factory=dict)
+
+
 class MockAPIServer:
     """
     Mock HTTP server for external APIs based on OpenAPI specifications.
@@ -43,7 +76,6 @@ class MockAPIServer:
         self.api_name = api_name
         self.spec_path = spec_path
         self.port = port
-        self.app = FastAPI(title=f"Mock {api_name.title()} API")
         
         # Dynamically import spec_loader from the API's directory
         spec_dir = spec_path.parent
@@ -71,49 +103,39 @@ class MockAPIServer:
         self._server_process: Optional[uvicorn.Server] = None
         self._actual_port: Optional[int] = None
         self._state: Dict[str, Any] = {}  # For maintaining state (e.g., deleted resources)
-        
-        # Load spec and build routes
-        self._build_routes()
+        self._routes: Dict[Tuple[str, str], RouteEntry] = {}
+        self._method_handlers = {
+            "get": self._handle_get,
+            "post": self._handle_post,
+            "put": self._handle_put,
+            "patch": self._handle_patch,
+            "delete": self._handle_delete,
+        }
+        
+        # Load spec and build routes. Handlers return raw Responses, so a bare
+        # Starlette app is enough (no dependency injection or body validation)
+        self.app = Starlette(
+            routes=self._build_routes(),
+            exception_handlers={HTTPException: _http_exception_handler}
+        )
     
     def _load_json_file(self, file_path: Path) -> Any:
         """Load JSON file from path."""
         if not file_path.exists():
             raise FileNotFoundError(f"Payload file not found: {file_path}")
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    
-    def _resolve_path_params(self, path_template: str, actual_path: str) -> Dict[str, str]:
-        """
-        Extract path parameters from actual path using template.
-        
-        Example:
-            template: "/posts/{id}"
-            actual: "/posts/123"
-            returns: {"id": "123"}
-        """
-        params = {}
-        template_parts = path_template.split("/")
-        actual_parts = actual_path.split("/")
-        
-        if len(template_parts) != len(actual_parts):
-            return params
-        
-        for template_part, actual_part in zip(template_parts, actual_parts):
-            if template_part.startswith("{") and template_part.endswith("}"):
-                param_name = template_part[1:-1]
-                params[param_name] = actual_part
-        
-        return params
+        return orjson.loads(file_path.read_bytes())
     
     def _find_matching_payload(
         self, 
-        method: str, 
-        path: str, 
+        operation: Dict[str, Any], 
         status_code: str = "200",
         path_params: Optional[Dict[str, str]] = None
     ) -> Optional[Any]:
         """
-        Find payload file for a given endpoint.
+        Find payload file for a given operation.
+        
+        The operation is the one already resolved for the route, so the
+        spec paths are not scanned again on each lookup.
         
         Tries multiple strategies:
         1. Exact match with path params (e.g., GET_posts_999_200.json for id=999)
@@ -121,115 +143,94 @@ class MockAPIServer:
         3. Generic match only if no ID parameter (e.g., GET_posts_200.json)
         """
         path_params = path_params or {}
-        spec = self.spec_loader._load_spec()
         
-        # Find matching path in spec
-        for spec_path, path_item in spec.get("paths", {}).items():
-            # Check if this spec path matches the actual path
-            if not self._path_matches(spec_path, path):
-                continue
+        # Get response
+        responses = operation.get("responses", {})
+        response = responses.get(status_code)
+        if not response:
+            return None
+        
+        # Get payload path from x-mock-payload
+        mock_payload = response.get("x-mock-payload")
+        if not mock_payload:
+            return None
+        
+        payload_path_template = self.spec_dir / mock_payload
+        
+        # If we have an ID parameter, we need exact match or matching ID in filename
+        if "id" in path_params:
+            requested_id = path_params["id"]
             
-            # Extract path params
-            extracted_params = self._resolve_path_params(spec_path, path)
-            path_params.update(extracted_params)
+            # Strategy 1: Try exact match with ID (e.g., GET_posts_999_200.json)
+            try:
+                payload_path = Path(str(payload_path_template).format(**path_params))
+                if payload_path.exists():
+                    return self._load_json_file(payload_path)
+            except (KeyError, ValueError):
+                pass
             
-            # Check if method exists
-            operation = path_item.get(method.lower())
-            if not operation:
-                continue
+            # Strategy 2: Check if template file has matching ID
+            # For specific IDs, we must have an exact match or matching ID in filename
+            if not payload_path_template.exists():
+                return None
             
-            # Get response
-            responses = operation.get("responses", {})
-            response = responses.get(status_code)
-            if not response:
-                continue
+            template_name = Path(payload_path_template).stem
+            # Extract all numbers from filename
+            numbers = re.findall(r'(\d+)', template_name)
             
-            # Get payload path from x-mock-payload
-            mock_payload = response.get("x-mock-payload")
-            if not mock_payload:
-                continue
+            if numbers and len(numbers) > 1:
+                # Check all numbers except the last one (status code)
+                candidates = numbers[:-1]
+            else:
+                # Only one number - could be status code or ID; no numbers
+                # means a generic template, not usable for specific IDs
+                candidates = numbers
             
-            payload_path_template = self.spec_dir / mock_payload
+            if requested_id in candidates:
+                # ID matches! Use this payload
+                payload = self._load_json_file(payload_path_template)
+                if isinstance(payload, dict):
+                    payload = payload.copy()
+                    payload["id"] = int(requested_id)
+                return payload
             
-            # If we have an ID parameter, we need exact match or matching ID in filename
-            if path_params and "id" in path_params:
-                requested_id = path_params["id"]
-                
-                # Strategy 1: Try exact match with ID (e.g., GET_posts_999_200.json)
-                try:
-                    payload_path = Path(str(payload_path_template).format(**path_params))
-                    if payload_path.exists():
-                        return self._load_json_file(payload_path)
-                except (KeyError, ValueError):
-                    pass
-                
-                # Strategy 2: Check if template file has matching ID
-                # For specific IDs, we must have an exact match or matching ID in filename
-                if not payload_path_template.exists():
-                    # Template file doesn't exist, skip this response
-                    continue
-                
-                template_name = Path(payload_path_template).stem
-                import re as re_module
-                # Extract all numbers from filename
-                numbers = re_module.findall(r'(\d+)', template_name)
-                
-                # Check if any number (except status code at end) matches requested ID
-                id_matched = False
-                if numbers and len(numbers) > 1:
-                    # Check all numbers except the last one (status code)
-                    for num_str in numbers[:-1]:
-                        if num_str == requested_id:
-                            # ID matches! Use this payload
-                            payload = self._load_json_file(payload_path_template)
-                            if isinstance(payload, dict):
-                                payload = payload.copy()
-                                payload["id"] = int(requested_id)
-                            return payload
-                    # Template has a different ID, don't use it
-                    id_matched = False
-                elif len(numbers) == 1:
-                    # Only one number - could be status code or ID
-                    # If it matches requested ID, use it
-                    if numbers[0] == requested_id:
-                        payload = self._load_json_file(payload_path_template)
-                        if isinstance(payload, dict):
-                            payload = payload.copy()
-                            payload["id"] = int(requested_id)
-                        return payload
-                    # Otherwise, it's probably status code, don't use it
-                    id_matched = False
-                else:
-                    # No numbers in filename - generic template, don't use for specific IDs
-                    id_matched = False
-                
-                # If we have an ID but template doesn't match, skip this response
-                if not id_matched:
-                    continue
-            else:
-                # No ID parameter - use template as-is (for endpoints like GET /posts)
-                if payload_path_template.exists():
-                    return self._load_json_file(payload_path_template)
+            # Template has a different ID, don't use it
+            return None
+        
+        # No ID parameter - use template as-is (for endpoints like GET /posts)
+        if payload_path_template.exists():
+            return self._load_json_file(payload_path_template)
         
         return None
     
-    def _path_matches(self, template: str, actual: str) -> bool:
+    def _precompute_route(self, method: str, spec_path: str, operation: Dict[str, Any]) -> RouteEntry:
         """
-        Check if actual path matches template path.
+        Build the RouteEntry for an operation.
         
-        Example:
-            template: "/posts/{id}"
-            actual: "/posts/123"
-            returns: True
+        GET operations without path params always serve the same payload
+        (no id substitution, no request body, no state), so the JSON is
+        encoded once here instead of on every request.
         """
-        # Convert template to regex
-        pattern = re.sub(r"\{[^}]+\}", r"[^/]+", template)
-        pattern = f"^{pattern}$"
-        return bool(re.match(pattern, actual))
+        status_code = 201 if method == "post" else 200
+        route_entry = RouteEntry(
+            method=method,
+            spec_path=spec_path,
+            operation=operation,
+            status_code=status_code,
+            read_entry=self._routes.get(("get", spec_path)),
+        )
+        
+        if method == "get" and "{" not in spec_path:
+            payload = self._find_matching_payload(operation, str(status_code))
+            if payload is not None:
+                route_entry.prebuilt_response_bytes = orjson.dumps(payload)
+        
+        return route_entry
     
-    def _build_routes(self):
-        """Build FastAPI routes from OpenAPI specification."""
+    def _build_routes(self) -> List[Route]:
+        """Build Starlette routes from OpenAPI specification."""
         spec = self.spec_loader._load_spec()
+        routes: List[Route] = []
         
         for path, path_item in spec.get("paths", {}).items():
             # Register each HTTP method
@@ -238,134 +239,191 @@ class MockAPIServer:
                 if not operation:
                     continue
                 
-                # Create route handler factory to capture variables correctly
-                def make_handler(method_name: str, spec_path: str, operation_def: Dict[str, Any]):
+                # "get" is registered first, so it is available as read_entry
+                # for the other methods of the same path
+                route_entry = self._precompute_route(method, path, operation)
+                self._routes[(method, path)] = route_entry
+                
+                # Create a handler specialized for this route: the entry and the
+                # verb handler are bound in the closure and path params come
+                # from the router match
+                def make_handler(route_entry: RouteEntry, method_handler):
+                    if route_entry.prebuilt_response_bytes is not None:
+                        async def static_route_handler(request: Request):
+                            return Response(
+                                content=route_entry.prebuilt_response_bytes,
+                                media_type="application/json",
+                                status_code=route_entry.status_code,
+                            )
+                        return static_route_handler
+                    
                     async def route_handler(request: Request):
-                        return await self._handle_request(request, method_name, spec_path, operation_def)
+                        return await method_handler(request, route_entry, request.path_params)
                     return route_handler
                 
                 # Create handler with captured variables
-                route_handler = make_handler(method, path, operation)
-                
-                # Register route with FastAPI
-                route_path = path
-                # FastAPI uses {param} format, which matches OpenAPI
+                route_handler = make_handler(route_entry, self._method_handlers[method])
                 
-                if method == "get":
-                    self.app.get(route_path)(route_handler)
-                elif method == "post":
-                    self.app.post(route_path)(route_handler)
-                elif method == "put":
-                    self.app.put(route_path)(route_handler)
-                elif method == "delete":
-                    self.app.delete(route_path)(route_handler)
-                elif method == "patch":
-                    self.app.patch(route_path)(route_handler)
+                # Starlette uses {param} format, which matches OpenAPI
+                routes.append(Route(path, endpoint=route_handler, methods=[method.upper()]))
+        
+        return routes
     
-    async def _handle_request(
-        self, 
-        request: Request, 
-        method: str, 
-        spec_path: str,
-        operation: Dict[str, Any]
+    def _lookup_payload(
+        self,
+        route_entry: Optional[RouteEntry],
+        status_code: str,
+        path_params: Dict[str, str]
+    ) -> Optional[Any]:
+        """
+        Find payload for a route, memoized per (status_code, path params).
+        
+        Cached payloads are shared between requests, so callers must copy
+        them before merging request data.
+        """
+        if route_entry is None:
+            return None
+        # Key on every path param, the same ones _find_matching_payload matches on
+        cache_key = (status_code, tuple(sorted(path_params.items())))
+        if cache_key not in route_entry.payload_cache:
+            route_entry.payload_cache[cache_key] = self._find_matching_payload(
+                route_entry.operation, status_code, dict(path_params)
+            )
+        return route_entry.payload_cache[cache_key]
+    
+    def _not_found_response(
+        self,
+        route_entry: RouteEntry,
+        actual_path: str,
+        path_params: Dict[str, str]
     ) -> Response:
+        """Return the spec's 404 payload for a route, or a generic 404 if none is mapped."""
+        payload = self._lookup_payload(route_entry, "404", path_params)
+        if payload:
+            return JSONResponse(content=payload, status_code=404)
+        return JSONResponse(
+            content={
+                "error": "Not found",
+                "message": f"No mock payload found for {route_entry.method} {actual_path}"
+            },
+            status_code=404
+        )
+    
+    async def _merge_request_body(
+        self,
+        request: Request,
+        payload: Any,
+        path_params: Dict[str, str]
+    ) -> Any:
         """
-        Handle incoming HTTP request and return appropriate response.
+        Merge the JSON request body into a copy of the payload (POST/PUT).
         
-        Args:
-            request: FastAPI request object
-            method: HTTP method
-            spec_path: Path template from OpenAPI spec
-            operation: Operation definition from OpenAPI spec
-            
-        Returns:
-            FastAPI Response with payload or error
+        The ID from the path, if any, wins over the body. The payload is
+        returned as-is if the body cannot be parsed.
         """
+        try:
+            request_body = await request.json()
+            if isinstance(payload, dict):
+                payload = payload.copy()
+                payload.update(request_body)
+                # Update ID if in path params
+                if "id" in path_params:
+                    try:
+                        payload["id"] = int(path_params["id"])
+                    except ValueError:
+                        pass
+        except Exception:
+            pass  # Use payload as-is if body parsing fails
+        return payload
+    
+    async def _handle_get(
+        self,
+        request: Request,
+        route_entry: RouteEntry,
+        path_params: Dict[str, str]
+    ) -> Response:
+        """Handle GET: serve the payload, or 404 for resources deleted earlier."""
         actual_path = request.url.path
-        path_params = self._resolve_path_params(spec_path, actual_path)
         
         # Check for state-based responses (e.g., deleted resources)
-        if method.lower() == "get" and "id" in path_params:
-            resource_id = path_params.get("id")
-            deleted_key = f"deleted_{self.api_name}_{resource_id}"
-            if self._state.get(deleted_key):
-                # Return 404 for deleted resource
-                payload = self._find_matching_payload(method, actual_path, "404", path_params)
-                if payload:
-                    return JSONResponse(content=payload, status_code=404)
-        
-        # Handle DELETE - update state and return 204
-        if method.lower() == "delete":
-            if "id" in path_params:
-                resource_id = path_params.get("id")
-                deleted_key = f"deleted_{self.api_name}_{resource_id}"
-                # Check if resource exists (not deleted)
-                payload = self._find_matching_payload("get", actual_path, "200", path_params)
-                if payload is None:
-                    # Resource doesn't exist
-                    error_payload = self._find_matching_payload("get", actual_path, "404", path_params)
-                    if error_payload:
-                        return JSONResponse(content=error_payload, status_code=404)
-                    return JSONResponse(
-                        content={"error": "Not found", "message": f"Resource not found"},
-                        status_code=404
-                    )
-                # Mark as deleted and return 204
-                self._state[deleted_key] = True
-                return Response(status_code=204)
-            else:
-                # DELETE without ID - return 204
-                return Response(status_code=204)
-        
-        # Determine status code based on method and operation
-        default_status = {
-            "get": "200",
-            "post": "201",
-            "put": "200",
-            "patch": "200"
-        }.get(method.lower(), "200")
+        if "id" in path_params and self._state.get(f"deleted_{self.api_name}_{path_params['id']}"):
+            payload = self._lookup_payload(route_entry, "404", path_params)
+            if payload:
+                return JSONResponse(content=payload, status_code=404)
         
-        # Try to find payload
-        payload = self._find_matching_payload(method, actual_path, default_status, path_params)
+        payload = self._lookup_payload(route_entry, "200", path_params)
+        if payload is None:
+            return self._not_found_response(route_entry, actual_path, path_params)
+        return JSONResponse(content=payload, status_code=200)
+    
+    async def _handle_post(
+        self,
+        request: Request,
+        route_entry: RouteEntry,
+        path_params: Dict[str, str]
+    ) -> Response:
+        """Handle POST: serve the 201 payload merged with the request body."""
+        actual_path = request.url.path
+        payload = self._lookup_payload(route_entry, "201", path_params)
+        if payload is None:
+            return self._not_found_response(route_entry, actual_path, path_params)
+        payload = await self._merge_request_body(request, payload, path_params)
+        return JSONResponse(content=payload, status_code=201)
+    
+    async def _handle_put(
+        self,
+        request: Request,
+        route_entry: RouteEntry,
+        path_params: Dict[str, str]
+    ) -> Response:
+        """Handle PUT: serve the 200 payload merged with the request body."""
+        actual_path = request.url.path
+        payload = self._lookup_payload(route_entry, "200", path_params)
+        if payload is None:
+            return self._not_found_response(route_entry, actual_path, path_params)
+        payload = await self._merge_request_body(request, payload, path_params)
+        return JSONResponse(content=payload, status_code=200)
+    
+    async def _handle_patch(
+        self,
+        request: Request,
+        route_entry: RouteEntry,
+        path_params: Dict[str, str]
+    ) -> Response:
+        """Handle PATCH: serve the 200 payload as-is."""
+        actual_path = request.url.path
+        payload = self._lookup_payload(route_entry, "200", path_params)
+        if payload is None:
+            return self._not_found_response(route_entry, actual_path, path_params)
+        return JSONResponse(content=payload, status_code=200)
+    
+    async def _handle_delete(
+        self,
+        request: Request,
+        route_entry: RouteEntry,
+        path_params: Dict[str, str]
+    ) -> Response:
+        """Handle DELETE: mark the resource as deleted and return 204."""
+        if "id" not in path_params:
+            # DELETE without ID - return 204
+            return Response(status_code=204)
         
+        actual_path = request.url.path
+        # Check if resource exists (through the GET operation of the same path)
+        payload = self._lookup_payload(route_entry.read_entry, "200", path_params)
         if payload is None:
-            # Try 404
-            payload = self._find_matching_payload(method, actual_path, "404", path_params)
-            if payload:
-                return JSONResponse(content=payload, status_code=404)
-            # No payload found
+            # Resource doesn't exist
+            error_payload = self._lookup_payload(route_entry.read_entry, "404", path_params)
+            if error_payload:
+                return JSONResponse(content=error_payload, status_code=404)
             return JSONResponse(
-                content={"error": "Not found", "message": f"No mock payload found for {method} {actual_path}"},
+                content={"error": "Not found", "message": "Resource not found"},
                 status_code=404
             )
         
-        # Handle POST/PUT - merge request body if needed
-        if method.lower() in ["post", "put"] and request.method in ["POST", "PUT"]:
-            try:
-                request_body = await request.json()
-                if isinstance(payload, dict):
-                    payload = payload.copy()
-                    payload.update(request_body)
-                    # Update ID if in path params
-                    if "id" in path_params:
-                        try:
-                            payload["id"] = int(path_params["id"])
-                        except ValueError:
-                            pass
-            except Exception:
-                pass  # Use payload as-is if body parsing fails
-        
-        # Return response
-        status_code = int(default_status)
-        if method.lower() == "post":
-            status_code = 201
-        elif method.lower() == "delete":
-            status_code = 204
-        
-        if status_code == 204:
-            return Response(status_code=204)
-        
-        return JSONResponse(content=payload, status_code=status_code)
+        # Mark as deleted and return 204
+        self._state[f"deleted_{self.api_name}_{path_params['id']}"] = True
+        return Response(status_code=204)
     
     def _find_free_port(self) -> int:
         """Find a free port on the system."""
@@ -394,7 +452,10 @@ class MockAPIServer:
             app=self.app,
             host="127.0.0.1",
             port=self.port,
-            log_level="error"  # Suppress uvicorn logs during tests
+            log_level="error",  # Suppress uvicorn logs during tests
+            # Keep the process-wide event loop policy (set in tests/conftest.py);
+            # "auto" would replace it from this thread when uvloop is installed
+            loop="none",
         )
         self._server_process = uvicorn.Server(config)
         
@@ -3,6 +3,7 @@ Post schema specification for tests.
 This is an independent schema that represents the expected API contract.
 Following TDD: test schema defines the contract, implementation must satisfy it.
 """
+import msgspec
 from pydantic import BaseModel
 from typing import Optional
 
@@ -24,6 +25,20 @@ class PostSpec(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class PostSpecStruct(msgspec.Struct):
+    """
+    msgspec mirror of PostSpec for hot read-only validation.
+    
+    Used to decode list responses in one pass; PostSpec remains the contract.
+    """
+    id: int
+    title: str
+    body: str
+    userId: int
+    createdAt: str  # ISO 8601 datetime string
+    updatedAt: Optional[str] = None
+
+
 class PostCreateSpec(BaseModel):
     """
     Post creation request specification model.
@@ -7,7 +7,13 @@ Changes here represent new requirements that the app must satisfy.
 Usage in tests:
     user = UserSpec(**response.json())  # Validates response matches spec
     assert user.email == expected_email  # Validate specific business logic
+
+For hot read-only assertions (e.g. list endpoints), decode the raw body
+in one pass with the msgspec mirror instead:
+    users = msgspec.json.decode(response.content, type=List[UserSpecStruct])
 """
+import ciso8601
+import msgspec
 from pydantic import BaseModel, EmailStr, field_validator
 from datetime import datetime
 from typing import Optional, Union
@@ -44,16 +50,31 @@ class UserSpec(BaseModel):
     @classmethod
     def parse_datetime(cls, v: Union[str, datetime]) -> datetime:
         """Parse datetime from string (JSON) or datetime object"""
-        if isinstance(v, str):
-            # FastAPI serializes datetime to ISO format string
-            return datetime.fromisoformat(v.replace('Z', '+00:00'))
-        return v
+        # FastAPI serializes datetime to ISO format string;
+        # ciso8601 parses it in C, including a trailing 'Z'
+        return ciso8601.parse_datetime(v) if isinstance(v, str) else v
     
     model_config = {
         "from_attributes": True,  # Allows conversion from dict/ORM objects
     }
 
 
+class UserSpecStruct(msgspec.Struct):
+    """
+    msgspec mirror of UserSpec for hot read-only validation.
+    
+    Decodes JSON straight into typed fields without Python-level validators.
+    UserSpec remains the contract documentation; keep both in sync.
+    Note: email format is not validated here, only its type.
+    """
+    id: int
+    email: str
+    username: str
+    is_active: bool
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+
 class UserCreateSpec(BaseModel):
     """
     User creation request specification for tests.
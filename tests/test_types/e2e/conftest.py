@@ -0,0 +1,24 @@
+"""
+E2E test configuration
+Shares one HTTP client per module; e2e tests here do not touch the database,
+so they don't need the db_session-backed client from tests/conftest.py.
+"""
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+
+
+@pytest.fixture(scope="module")
+def client():
+    """
+    Synchronous HTTP client shared by all tests of a module.
+    
+    The endpoints covered here are plain request/response checks, so the
+    sync TestClient is enough and no event loop is needed per test. Using it
+    as a context manager keeps one ASGI portal open for the whole module.
+    
+    Yields:
+        TestClient: HTTP client bound to the app
+    """
+    with TestClient(app) as test_client:
+        yield test_client
@@ -1,25 +1,18 @@
 """
 Basic end-to-end test example
 """
-import pytest
-from httpx import AsyncClient
-from app.main import app
+from fastapi.testclient import TestClient
 
 
-@pytest.mark.asyncio
-async def test_root_endpoint_e2e():
+def test_root_endpoint_e2e(client: TestClient):
     """E2E test for root endpoint"""
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        response = await client.get("/")
-        assert response.status_code == 200
-        assert response.json() == {"message": "Hello World"}
+    response = client.get("/")
+    assert response.status_code == 200
+    assert response.json() == {"message": "Hello World"}
 
 
-@pytest.mark.asyncio
-async def test_health_endpoint_e2e():
+def test_health_endpoint_e2e(client: TestClient):
     """E2E test for health check endpoint"""
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        response = await client.get("/health")
-        assert response.status_code == 200
-        assert response.json() == {"status": "healthy"}
-
+    response = client.get("/health")
+    assert response.status_code == 200
+    assert response.json() == {"status": "healthy"}
@@ -4,10 +4,16 @@ We expect:
  - The 'example_items' table exists (created from SQL migrations)
  - There is at least one row seeded with name='ping'
 """
+import pytest
 from sqlalchemy import text
 
+pytestmark = pytest.mark.integration
+
 
 def test_example_items_table_exists_and_seeded(db_engine):
+    if db_engine.dialect.name != "postgresql":
+        pytest.skip("SQL migrations and information_schema check are Postgres-only")
+    
     # Check table exists via information_schema
     with db_engine.connect() as conn:
         exists = conn.execute(
@@ -6,251 +6,195 @@ These tests mock an external API and use assets from tests/infrastructure/extern
 to ensure consistent test data without centralizing the mock definition.
 The assets are loaded dynamically at test execution time.
 """
+import json
+import re
+import httpx
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+import msgspec
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
 from httpx import AsyncClient
 
-from tests.infrastructure.schemas.post import PostSpec, PostCreateSpec, PostUpdateSpec
-from tests.infrastructure.external_apis.posts.mock import PostsMock
+from app.main import app
+from app.services.posts_service import PostsService, get_posts_service
 
+from tests.infrastructure.schemas.post import PostSpec, PostSpecStruct, PostCreateSpec, PostUpdateSpec
 
-@pytest.fixture
-def posts_mock():
-    """Fixture that provides PostsMock instance for loading assets"""
-    return PostsMock()
+pytestmark = pytest.mark.integration
 
 
-@pytest.fixture
-def mock_external_api(posts_mock):
+# Matches ".../posts" (group 1 is None) and ".../posts/<id>" (group 1 is the id)
+_POSTS_URL_RE = re.compile(r"/posts(?:/(\d+))?$")
+# Payload for URLs the mocked API doesn't serve
+_NOT_FOUND_PAYLOAD = {"error": "Not found"}
+# updatedAt stamped on mocked PUT responses; tests only check it is set, so
+# one timestamp per test run is enough
+_UPDATED_AT = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+
+
+@pytest.fixture(scope="module")
+def _posts_api_transport(posts_mock):
     """
-    Fixture that mocks the external Posts API.
-    Returns mock responses based on assets loaded from infrastructure/external_apis/assets/posts/
+    Module-scoped httpx.MockTransport serving the external Posts API.
+    
+    Requests still go through real httpx request/response handling; only
+    the network is replaced. Per-test state lives in deleted_posts, which
+    mock_external_api clears before each test.
+    
+    Yields:
+        Tuple of (PostsService using the mock transport, deleted_posts)
     """
     # Track deleted posts to maintain state across calls
     deleted_posts = set()
     
-    with patch('app.services.posts_service.httpx.AsyncClient') as mock_client_class:
-        mock_client = AsyncMock()
-        mock_context_manager = AsyncMock()
-        mock_context_manager.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_context_manager.__aexit__ = AsyncMock(return_value=None)
-        mock_client_class.return_value = mock_context_manager
+    # Assets are loaded once here and reused by every mocked call; the
+    # handlers never mutate them (PUT works on a copy)
+    all_posts = posts_mock.get_all_posts()
+    create_response = posts_mock.get_create_response()
+    posts_by_id: Dict[int, Optional[Dict[str, Any]]] = {}
+    not_found_by_id: Dict[int, Dict[str, Any]] = {}
+    
+    def get_post(post_id: int) -> Optional[Dict[str, Any]]:
+        """Memoized posts_mock.get_post_by_id"""
+        if post_id not in posts_by_id:
+            posts_by_id[post_id] = posts_mock.get_post_by_id(post_id)
+        return posts_by_id[post_id]
+    
+    def not_found(post_id: int) -> httpx.Response:
+        """404 response for a post id (memoized payload)"""
+        if post_id not in not_found_by_id:
+            not_found_by_id[post_id] = posts_mock.get_not_found_error(post_id)
+        return httpx.Response(404, json=not_found_by_id[post_id])
+    
+    # Configure mock responses based on assets
+    def handle_get(post_id: Optional[int], request: httpx.Request) -> httpx.Response:
+        if post_id is None:
+            # GET all posts
+            return httpx.Response(200, json=all_posts)
         
-        # Configure mock responses based on assets
-        async def mock_get(url, **kwargs):
-            mock_response = MagicMock()
-            
-            if url.endswith("/posts"):
-                # GET all posts
-                data = posts_mock.get_all_posts()
-                mock_response.status_code = 200
-                mock_response.json = MagicMock(return_value=data)
-                mock_response.raise_for_status = MagicMock()
-            elif "/posts/" in url:
-                # GET post by ID
-                post_id = int(url.split("/posts/")[-1])
-                
-                # Check if post was deleted
-                if post_id in deleted_posts:
-                    from httpx import HTTPStatusError
-                    error_data = posts_mock.get_not_found_error(post_id)
-                    mock_response.status_code = 404
-                    mock_response.json = MagicMock(return_value=error_data)
-                    mock_response.raise_for_status = MagicMock(
-                        side_effect=HTTPStatusError(
-                            "404 Not Found",
-                            request=MagicMock(),
-                            response=MagicMock(status_code=404)
-                        )
-                    )
-                else:
-                    data = posts_mock.get_post_by_id(post_id)
-                    
-                    if data:
-                        mock_response.status_code = 200
-                        mock_response.json = MagicMock(return_value=data)
-                        mock_response.raise_for_status = MagicMock()
-                    else:
-                        # Post not found - raise HTTPStatusError for 404
-                        from httpx import HTTPStatusError
-                        error_data = posts_mock.get_not_found_error(post_id)
-                        mock_response.status_code = 404
-                        mock_response.json = MagicMock(return_value=error_data)
-                        mock_response.raise_for_status = MagicMock(
-                            side_effect=HTTPStatusError(
-                                "404 Not Found",
-                                request=MagicMock(),
-                                response=MagicMock(status_code=404)
-                            )
-                        )
-            else:
-                from httpx import HTTPStatusError
-                mock_response.status_code = 404
-                mock_response.json = MagicMock(return_value={"error": "Not found"})
-                mock_response.raise_for_status = MagicMock(
-                    side_effect=HTTPStatusError(
-                        "404 Not Found",
-                        request=MagicMock(),
-                        response=MagicMock(status_code=404)
-                    )
-                )
-            
-            return mock_response
+        # GET post by ID; deleted posts are gone
+        data = None if post_id in deleted_posts else get_post(post_id)
+        if data:
+            return httpx.Response(200, json=data)
+        # Post not found
+        return not_found(post_id)
+    
+    def handle_post(post_id: Optional[int], request: httpx.Request) -> httpx.Response:
+        if post_id is not None:
+            return httpx.Response(404, json=_NOT_FOUND_PAYLOAD)
         
-        async def mock_post(url, json=None, **kwargs):
-            mock_response = MagicMock()
-            
-            if url.endswith("/posts"):
-                # POST create post
-                data = posts_mock.get_create_response()
-                mock_response.status_code = 201
-                mock_response.json = MagicMock(return_value=data)
-                mock_response.raise_for_status = MagicMock()
-            else:
-                from httpx import HTTPStatusError
-                mock_response.status_code = 404
-                mock_response.json = MagicMock(return_value={"error": "Not found"})
-                mock_response.raise_for_status = MagicMock(
-                    side_effect=HTTPStatusError(
-                        "404 Not Found",
-                        request=MagicMock(),
-                        response=MagicMock(status_code=404)
-                    )
-                )
-            
-            return mock_response
+        # POST create post
+        return httpx.Response(201, json=create_response)
+    
+    def handle_put(post_id: Optional[int], request: httpx.Request) -> httpx.Response:
+        if post_id is None:
+            return httpx.Response(404, json=_NOT_FOUND_PAYLOAD)
         
-        async def mock_put(url, json=None, **kwargs):
-            mock_response = MagicMock()
-            
-            if "/posts/" in url:
-                post_id = int(url.split("/posts/")[-1])
-                
-                # Check if post was deleted
-                if post_id in deleted_posts:
-                    from httpx import HTTPStatusError
-                    error_data = posts_mock.get_not_found_error(post_id)
-                    mock_response.status_code = 404
-                    mock_response.json = MagicMock(return_value=error_data)
-                    mock_response.raise_for_status = MagicMock(
-                        side_effect=HTTPStatusError(
-                            "404 Not Found",
-                            request=MagicMock(),
-                            response=MagicMock(status_code=404)
-                        )
-                    )
-                else:
-                    existing_post = posts_mock.get_post_by_id(post_id)
-                    
-                    if existing_post:
-                        # Update successful - merge existing post with update data
-                        update_data = json if json else {}
-                        # Start with existing post data
-                        data = existing_post.copy()
-                        # Apply only provided fields (partial update)
-                        data.update({k: v for k, v in update_data.items() if v is not None})
-                        data["id"] = post_id  # Ensure ID matches
-                        # Update timestamp if any field changed
-                        if update_data:
-                            from datetime import datetime, timezone
-                            data["updatedAt"] = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
-                        mock_response.status_code = 200
-                        mock_response.json = MagicMock(return_value=data)
-                        mock_response.raise_for_status = MagicMock()
-                    else:
-                        # Post not found
-                        from httpx import HTTPStatusError
-                        error_data = posts_mock.get_not_found_error(post_id)
-                        mock_response.status_code = 404
-                        mock_response.json = MagicMock(return_value=error_data)
-                        mock_response.raise_for_status = MagicMock(
-                            side_effect=HTTPStatusError(
-                                "404 Not Found",
-                                request=MagicMock(),
-                                response=MagicMock(status_code=404)
-                            )
-                        )
-            else:
-                from httpx import HTTPStatusError
-                mock_response.status_code = 404
-                mock_response.json = MagicMock(return_value={"error": "Not found"})
-                mock_response.raise_for_status = MagicMock(
-                    side_effect=HTTPStatusError(
-                        "404 Not Found",
-                        request=MagicMock(),
-                        response=MagicMock(status_code=404)
-                    )
-                )
-            
-            return mock_response
+        existing_post = None if post_id in deleted_posts else get_post(post_id)
+        if not existing_post:
+            # Post not found
+            return not_found(post_id)
         
-        async def mock_delete(url, **kwargs):
-            mock_response = MagicMock()
-            
-            if "/posts/" in url:
-                post_id = int(url.split("/posts/")[-1])
-                
-                # Check if already deleted
-                if post_id in deleted_posts:
-                    from httpx import HTTPStatusError
-                    error_data = posts_mock.get_not_found_error(post_id)
-                    mock_response.status_code = 404
-                    mock_response.json = MagicMock(return_value=error_data)
-                    mock_response.raise_for_status = MagicMock(
-                        side_effect=HTTPStatusError(
-                            "404 Not Found",
-                            request=MagicMock(),
-                            response=MagicMock(status_code=404)
-                        )
-                    )
-                else:
-                    existing_post = posts_mock.get_post_by_id(post_id)
-                    
-                    if existing_post:
-                        # Delete successful - mark as deleted
-                        deleted_posts.add(post_id)
-                        mock_response.status_code = 204
-                        mock_response.json = MagicMock(return_value=None)
-                        mock_response.raise_for_status = MagicMock()
-                    else:
-                        # Post not found
-                        from httpx import HTTPStatusError
-                        error_data = posts_mock.get_not_found_error(post_id)
-                        mock_response.status_code = 404
-                        mock_response.json = MagicMock(return_value=error_data)
-                        mock_response.raise_for_status = MagicMock(
-                            side_effect=HTTPStatusError(
-                                "404 Not Found",
-                                request=MagicMock(),
-                                response=MagicMock(status_code=404)
-                            )
-                        )
-            else:
-                from httpx import HTTPStatusError
-                mock_response.status_code = 404
-                mock_response.json = MagicMock(return_value={"error": "Not found"})
-                mock_response.raise_for_status = MagicMock(
-                    side_effect=HTTPStatusError(
-                        "404 Not Found",
-                        request=MagicMock(),
-                        response=MagicMock(status_code=404)
-                    )
-                )
-            
-            return mock_response
+        # Update successful - merge existing post with update data
+        update_data = json.loads(request.content) if request.content else {}
+        # Existing post + only provided fields (partial update), ID must match;
+        # built as a single new dict, the cached post is never mutated
+        data = {
+            **existing_post,
+            **{k: v for k, v in update_data.items() if v is not None},
+            "id": post_id,
+        }
+        # Update timestamp if any field changed
+        if update_data:
+            data["updatedAt"] = _UPDATED_AT
+        return httpx.Response(200, json=data)
+    
+    def handle_delete(post_id: Optional[int], request: httpx.Request) -> httpx.Response:
+        if post_id is None:
+            return httpx.Response(404, json=_NOT_FOUND_PAYLOAD)
         
-        mock_client.get = mock_get
-        mock_client.post = mock_post
-        mock_client.put = mock_put
-        mock_client.delete = mock_delete
+        existing_post = None if post_id in deleted_posts else get_post(post_id)
+        if not existing_post:
+            # Post not found (or already deleted)
+            return not_found(post_id)
         
-        yield mock_client
+        # Delete successful - mark as deleted
+        deleted_posts.add(post_id)
+        return httpx.Response(204)
+    
+    handlers = {
+        "GET": handle_get,
+        "POST": handle_post,
+        "PUT": handle_put,
+        "DELETE": handle_delete,
+    }
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        method_handler = handlers.get(request.method)
+        if method_handler is None:
+            # Fail fast: PostsService uses a verb the mock doesn't serve
+            raise AssertionError(f"Posts API mock has no handler for {request.method} {request.url}")
+        match = _POSTS_URL_RE.search(request.url.path)
+        if not match:
+            return httpx.Response(404, json=_NOT_FOUND_PAYLOAD)
+        post_id = int(match.group(1)) if match.group(1) is not None else None
+        return method_handler(post_id, request)
+    
+    service = PostsService(transport=httpx.MockTransport(handler))
+    yield service, deleted_posts
+
+
+@pytest.fixture(scope="module")
+def expected_posts_by_id(posts_mock) -> Dict[int, Dict[str, Any]]:
+    """
+    Posts served by GET /posts on the mocked API, keyed by id.
+    
+    Built once per module so list tests look posts up by id instead of
+    rebuilding expected data per test or relying on response order.
+    """
+    return {post["id"]: post for post in posts_mock.get_all_posts()}
+
+
+@pytest.fixture
+def mock_external_api(_posts_api_transport):
+    """
+    Fixture that mocks the external Posts API.
+    Returns mock responses based on assets loaded from infrastructure/external_apis/assets/posts/
+    
+    Overrides the get_posts_service dependency with a PostsService backed by
+    the module-scoped MockTransport, and starts each test with no deleted posts.
+    """
+    service, deleted_posts = _posts_api_transport
+    deleted_posts.clear()
+    app.dependency_overrides[get_posts_service] = lambda: service
+    yield service
+    app.dependency_overrides.pop(get_posts_service, None)
+
+
+@pytest.fixture
+def posts_service_unreachable():
+    """
+    For validation (422) tests, which must not reach the service layer.
+    
+    They don't use mock_external_api (keep it opt-in, never autouse); instead
+    the PostsService fails the test on any call (FastAPI resolves
+    dependencies before reporting validation errors, so only using the
+    service, not creating it, means validation was passed), rather than
+    calling the real external API.
+    """
+    def fail(request: httpx.Request) -> httpx.Response:
+        raise AssertionError(f"Validation test reached the Posts service: {request.method} {request.url}")
+    
+    service = PostsService(transport=httpx.MockTransport(fail))
+    app.dependency_overrides[get_posts_service] = lambda: service
+    yield
+    app.dependency_overrides.pop(get_posts_service, None)
 
 
 # ==================== GET /posts Tests ====================
 
 @pytest.mark.asyncio
-async def test_get_all_posts_success(client: AsyncClient, mock_external_api, posts_mock):
+async def test_get_all_posts_success(client: AsyncClient, mock_external_api, expected_posts_by_id):
     """
     Test GET /posts returns all posts from external API.
     
@@ -263,22 +207,21 @@ async def test_get_all_posts_success(client: AsyncClient, mock_external_api, pos
     response = await client.get("/posts")
     
     assert response.status_code == 200
-    data = response.json()
     
-    # Validate response is a list
-    assert isinstance(data, list)
+    # Validate response is a list whose items match the PostSpec specification
+    # (msgspec mirror: decodes and type-checks the whole list in one pass)
+    posts = msgspec.json.decode(response.content, type=List[PostSpecStruct])
     
-    # Validate each post matches PostSpec specification
-    # This ensures the app response satisfies the expected contract
-    expected_posts = posts_mock.get_all_posts()
-    assert len(data) == len(expected_posts)
+    # Same posts as the external API returned, in any order (ids are unique per post)
+    assert len(posts) == len(expected_posts_by_id)
+    assert {post.id for post in posts} == expected_posts_by_id.keys()
     
-    for post_data in data:
-        post = PostSpec(**post_data)
+    for post in posts:
+        expected = expected_posts_by_id[post.id]
         assert post.id > 0
-        assert post.title
-        assert post.body
-        assert post.userId > 0
+        assert post.title == expected["title"]
+        assert post.body == expected["body"]
+        assert post.userId == expected["userId"]
         assert post.createdAt
 
 
@@ -296,14 +239,10 @@ async def test_get_post_by_id_success(client: AsyncClient, mock_external_api, po
     data = response.json()
     
     # Validate response matches PostSpec specification
-    post = PostSpec(**data)
+    PostSpec(**data)
     
-    # Validate specific business logic using assets
-    expected_post = posts_mock.get_post_by_id(post_id)
-    assert post.id == expected_post["id"]
-    assert post.title == expected_post["title"]
-    assert post.body == expected_post["body"]
-    assert post.userId == expected_post["userId"]
+    # Validate specific business logic using assets (plain dict comparison)
+    assert data == posts_mock.get_post_by_id(post_id)
 
 
 @pytest.mark.asyncio
@@ -322,13 +261,21 @@ async def test_get_post_by_id_not_found(client: AsyncClient, mock_external_api):
 
 
 @pytest.mark.asyncio
-async def test_get_post_invalid_id_format(client: AsyncClient):
+@pytest.mark.parametrize(
+    "method,kwargs",
+    [
+        ("get", {}),
+        ("put", {"json": {"title": "Updated Title"}}),
+        ("delete", {}),
+    ],
+)
+async def test_post_invalid_id_format(client: AsyncClient, posts_service_unreachable, method, kwargs):
     """
-    Test GET /posts/{id} returns 422 when ID is not a valid integer.
+    Test GET/PUT/DELETE /posts/{id} return 422 when ID is not a valid integer.
     
     RED phase: This test will fail because the endpoint doesn't exist yet.
     """
-    response = await client.get("/posts/invalid-id")
+    response = await getattr(client, method)("/posts/invalid-id", **kwargs)
     
     assert response.status_code == 422
     data = response.json()
@@ -365,27 +312,27 @@ async def test_create_post_success(client: AsyncClient, mock_external_api, posts
 
 
 @pytest.mark.asyncio
-async def test_create_post_missing_required_fields(client: AsyncClient):
+@pytest.mark.parametrize(
+    "post_data",
+    [
+        {"body": "Test body", "userId": 1},  # Missing title
+        {"title": "Test title", "userId": 1},  # Missing body
+        {"title": "Test title", "body": "Test body"},  # Missing userId
+    ],
+    ids=["missing-title", "missing-body", "missing-userId"],
+)
+async def test_create_post_missing_required_fields(client: AsyncClient, posts_service_unreachable, post_data):
     """
     Test POST /posts returns 422 when required fields are missing.
     
     RED phase: This test will fail because the endpoint doesn't exist yet.
     """
-    # Missing title
-    response = await client.post("/posts", json={"body": "Test body", "userId": 1})
-    assert response.status_code == 422
-    
-    # Missing body
-    response = await client.post("/posts", json={"title": "Test title", "userId": 1})
-    assert response.status_code == 422
-    
-    # Missing userId
-    response = await client.post("/posts", json={"title": "Test title", "body": "Test body"})
+    response = await client.post("/posts", json=post_data)
     assert response.status_code == 422
 
 
 @pytest.mark.asyncio
-async def test_create_post_invalid_user_id_format(client: AsyncClient):
+async def test_create_post_invalid_user_id_format(client: AsyncClient, posts_service_unreachable):
     """
     Test POST /posts returns 422 when userId is not a valid integer.
     
@@ -472,22 +419,6 @@ async def test_update_post_not_found(client: AsyncClient, mock_external_api):
     assert "detail" in data or "error" in data
 
 
-@pytest.mark.asyncio
-async def test_update_post_invalid_id_format(client: AsyncClient):
-    """
-    Test PUT /posts/{id} returns 422 when ID is not a valid integer.
-    
-    RED phase: This test will fail because the endpoint doesn't exist yet.
-    """
-    update_data = {"title": "Updated Title"}
-    
-    response = await client.put("/posts/invalid-id", json=update_data)
-    
-    assert response.status_code == 422
-    data = response.json()
-    assert "detail" in data
-
-
 # ==================== DELETE /posts/{id} Tests ====================
 
 @pytest.mark.asyncio
@@ -521,18 +452,3 @@ async def test_delete_post_not_found(client: AsyncClient, mock_external_api):
     assert response.status_code == 404
     data = response.json()
     assert "detail" in data or "error" in data
-
-
-@pytest.mark.asyncio
-async def test_delete_post_invalid_id_format(client: AsyncClient):
-    """
-    Test DELETE /posts/{id} returns 422 when ID is not a valid integer.
-    
-    RED phase: This test will fail because the endpoint doesn't exist yet.
-    """
-    response = await client.delete("/posts/invalid-id")
-    
-    assert response.status_code == 422
-    data = response.json()
-    assert "detail" in data
-
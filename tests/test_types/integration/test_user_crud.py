@@ -7,37 +7,111 @@ which is the independent specification model. This ensures tests
 validate that the app satisfies requirements, not just internal consistency.
 """
 import pytest
+import msgspec
+from typing import List
 from httpx import AsyncClient
+from sqlalchemy import Boolean, Column, DateTime, Integer, MetaData, String, Table, func, insert, text
 from app.main import app
-from tests.infrastructure.schemas.user import UserSpec
+from tests.infrastructure.schemas.user import (
+    UserCreateSpec,
+    UserSpec,
+    UserSpecStruct,
+    UserUpdateSpec,
+)
 
+pytestmark = pytest.mark.integration
 
-@pytest.mark.asyncio
-async def test_get_users_empty_list_when_no_users(client: AsyncClient):
+
+# Timestamps are set by the database, so no created_at/updated_at params are sent
+_INSERT_USER_SQL = text(
+    "INSERT INTO users (email, username, is_active, created_at, updated_at) "
+    "VALUES (:email, :username, :is_active, CURRENT_TIMESTAMP, NULL) RETURNING id"
+)
+
+
+def _make_user(db_session, *, email: str, username: str, is_active: bool = True) -> int:
     """
-    Test GET /users returns empty list when no users exist.
+    Insert a single user directly in the database and return its id.
     
-    RED phase: This test will fail because the endpoint doesn't exist yet.
+    Reuses one module-level TextClause so every test hits the same
+    compiled statement cache entry.
     """
-    response = await client.get("/users")
+    return db_session.execute(
+        _INSERT_USER_SQL,
+        {"email": email, "username": username, "is_active": is_active}
+    ).scalar()
+
+
+# Users seeded by test_get_users_list_with_multiple_users: (email, username, is_active)
+_SEED_USERS = (
+    ("user1@example.com", "user1", True),
+    ("user2@example.com", "user2", True),
+    ("user3@example.com", "user3", False),
+)
+
+
+# Typed decoder for GET /users, built once per process instead of per decode call
+_USER_LIST_DECODER = msgspec.json.Decoder(List[UserSpecStruct])
+
+
+def _expect(data: dict, **fields) -> None:
+    """
+    Assert that a response dict has the given field values.
     
-    assert response.status_code == 200
-    data = response.json()
-    assert data == []
+    Plain dict comparison for happy-path checks; the full UserSpec
+    contract is validated once in test_get_user_by_id_success.
+    """
+    assert {key: data.get(key) for key in fields} == fields
+
+
+# Lightweight Core table for bulk seeding (independent of app models)
+users_table = Table(
+    "users",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("email", String),
+    Column("username", String),
+    Column("is_active", Boolean),
+    Column("created_at", DateTime),
+    Column("updated_at", DateTime),
+)
+
+
+@pytest.fixture
+def make_users(db_session):
+    """
+    Factory fixture that seeds users with one Core insert().returning().
+    
+    Each row needs email and username; is_active defaults to True and
+    created_at/updated_at are set in SQL (now() / NULL). All rows go in a
+    single batched statement inside the test SAVEPOINT.
+    
+    Returns:
+        Callable taking a list of row dicts and returning the new ids in row order
+    """
+    def _make(rows: List[dict]) -> List[int]:
+        rows = [{"is_active": True, **row} for row in rows]
+        stmt = (
+            insert(users_table)
+            .values(created_at=func.now(), updated_at=None)
+            .returning(users_table.c.id, sort_by_parameter_order=True)
+        )
+        return db_session.execute(stmt, rows).scalars().all()
+    return _make
 
 
 @pytest.mark.asyncio
-async def test_get_user_by_id_not_found(client: AsyncClient):
+async def test_get_users_empty_list_when_no_users(client: AsyncClient):
     """
-    Test GET /users/{id} returns 404 when user doesn't exist.
+    Test GET /users returns empty list when no users exist.
     
     RED phase: This test will fail because the endpoint doesn't exist yet.
     """
-    response = await client.get("/users/999")
+    response = await client.get("/users")
     
-    assert response.status_code == 404
+    assert response.status_code == 200
     data = response.json()
-    assert "detail" in data
+    assert data == []
 
 
 @pytest.mark.asyncio
@@ -54,26 +128,9 @@ async def test_get_user_by_id_success(client: AsyncClient, db_session):
     - The endpoint doesn't exist
     - We need to create the user in DB first
     """
-    from sqlalchemy import text
-    from datetime import datetime
-    
     # Create a user directly in the database
-    result = db_session.execute(
-        text("""
-            INSERT INTO users (email, username, is_active, created_at, updated_at)
-            VALUES (:email, :username, :is_active, :created_at, :updated_at)
-            RETURNING id
-        """),
-        {
-            "email": "test@example.com",
-            "username": "testuser",
-            "is_active": True,
-            "created_at": datetime.now(),
-            "updated_at": None
-        }
-    )
-    user_id = result.scalar()
-    db_session.commit()
+    user_id = _make_user(db_session, email="test@example.com", username="testuser")
+    db_session.flush()
     
     # Now test the GET endpoint
     response = await client.get(f"/users/{user_id}")
@@ -94,7 +151,7 @@ async def test_get_user_by_id_success(client: AsyncClient, db_session):
 
 
 @pytest.mark.asyncio
-async def test_get_users_list_with_multiple_users(client: AsyncClient, db_session):
+async def test_get_users_list_with_multiple_users(client: AsyncClient, db_session, make_users):
     """
     Test GET /users returns list of all users.
     
@@ -105,68 +162,33 @@ async def test_get_users_list_with_multiple_users(client: AsyncClient, db_sessio
     
     RED phase: This test will fail because the endpoint doesn't exist yet.
     """
-    from sqlalchemy import text
-    from datetime import datetime
-    
-    # Create multiple users
-    users_data = [
-        ("user1@example.com", "user1", True),
-        ("user2@example.com", "user2", True),
-        ("user3@example.com", "user3", False),
-    ]
-    
-    created_ids = []
-    for email, username, is_active in users_data:
-        result = db_session.execute(
-            text("""
-                INSERT INTO users (email, username, is_active, created_at, updated_at)
-                VALUES (:email, :username, :is_active, :created_at, :updated_at)
-                RETURNING id
-            """),
-            {
-                "email": email,
-                "username": username,
-                "is_active": is_active,
-                "created_at": datetime.now(),
-                "updated_at": None
-            }
-        )
-        created_ids.append(result.scalar())
-    db_session.commit()
+    # Create multiple users, all rows in one round-trip
+    created_ids = make_users([
+        {"email": email, "username": username, "is_active": is_active}
+        for email, username, is_active in _SEED_USERS
+    ])
+    db_session.flush()
     
     # Test GET /users
     response = await client.get("/users")
     
     assert response.status_code == 200
-    data = response.json()
     
-    # Should return all users
-    assert len(data) >= len(users_data)  # At least our created users
+    # Validate each user matches the UserSpec specification
+    # (msgspec mirror: decodes and type-checks the whole list in one pass)
+    users = _USER_LIST_DECODER.decode(response.content)
     
-    # Validate each user matches UserSpec specification
-    # This ensures all users in the response satisfy the expected contract
-    users = [UserSpec(**item) for item in data]
+    # Should return all users
+    assert len(users) >= len(_SEED_USERS)  # At least our created users
     
-    # Verify our created users are in the response
+    # Verify our created users are in the response under the ids they got
     # (business logic validation)
-    user_emails = {user.email for user in users}
-    assert "user1@example.com" in user_emails
-    assert "user2@example.com" in user_emails
-    assert "user3@example.com" in user_emails
-
-
-@pytest.mark.asyncio
-async def test_get_user_invalid_id_format(client: AsyncClient):
-    """
-    Test GET /users/{id} returns 422 when ID is not a valid integer.
-    
-    RED phase: This test will fail because the endpoint doesn't exist yet.
-    """
-    response = await client.get("/users/invalid-id")
-    
-    assert response.status_code == 422
-    data = response.json()
-    assert "detail" in data
+    users_by_id = {user.id: user for user in users}
+    for user_id, (email, username, is_active) in zip(created_ids, _SEED_USERS):
+        assert user_id in users_by_id
+        assert users_by_id[user_id].email == email
+        assert users_by_id[user_id].username == username
+        assert users_by_id[user_id].is_active == is_active
 
 
 # ==================== POST /users (CREATE) Tests ====================
@@ -178,8 +200,6 @@ async def test_create_user_success(client: AsyncClient):
     
     RED phase: This test will fail because the endpoint doesn't exist yet.
     """
-    from tests.infrastructure.schemas.user import UserCreateSpec
-    
     user_data = UserCreateSpec(
         email="newuser@example.com",
         username="newuser",
@@ -191,91 +211,41 @@ async def test_create_user_success(client: AsyncClient):
     assert response.status_code == 201
     data = response.json()
     
-    # Validate response matches UserSpec
-    user = UserSpec(**data)
-    assert user.email == "newuser@example.com"
-    assert user.username == "newuser"
-    assert user.is_active is True
-    assert user.id is not None
-    assert user.created_at is not None
+    # Validate returned fields (schema contract is checked in test_get_user_by_id_success)
+    _expect(data, email="newuser@example.com", username="newuser", is_active=True)
+    assert data["id"] is not None
+    assert data["created_at"] is not None
 
 
 @pytest.mark.asyncio
-async def test_create_user_duplicate_email(client: AsyncClient, db_session):
+@pytest.mark.parametrize(
+    "field,value",
+    [
+        ("email", "existing@example.com"),
+        ("username", "existing_username"),
+    ],
+)
+async def test_create_user_duplicate(client: AsyncClient, db_session, make_users, field, value):
     """
-    Test POST /users returns 409 when email already exists.
+    Test POST /users returns 409 when email or username already exists.
     
     RED phase: This test will fail because the endpoint doesn't exist yet.
     """
-    from sqlalchemy import text
-    from datetime import datetime
-    from tests.infrastructure.schemas.user import UserCreateSpec
-    
-    # Create a user in the database first
-    db_session.execute(
-        text("""
-            INSERT INTO users (email, username, is_active, created_at, updated_at)
-            VALUES (:email, :username, :is_active, :created_at, :updated_at)
-        """),
-        {
-            "email": "existing@example.com",
-            "username": "existing",
-            "is_active": True,
-            "created_at": datetime.now(),
-            "updated_at": None
-        }
-    )
-    db_session.commit()
+    # Create a user in the database first that owns the conflicting value
+    seed_user = {"email": "seed@example.com", "username": "seed_user"}
+    seed_user[field] = value
+    make_users([seed_user])
+    db_session.flush()
     
-    # Try to create another user with the same email
+    # Try to create another user reusing only that value
     user_data = UserCreateSpec(
-        email="existing@example.com",
+        email="newuser@example.com",
         username="newuser",
         is_active=True
-    )
-    
-    response = await client.post("/users", json=user_data.model_dump())
-    
-    assert response.status_code == 409
-    data = response.json()
-    assert "detail" in data
-
-
-@pytest.mark.asyncio
-async def test_create_user_duplicate_username(client: AsyncClient, db_session):
-    """
-    Test POST /users returns 409 when username already exists.
-    
-    RED phase: This test will fail because the endpoint doesn't exist yet.
-    """
-    from sqlalchemy import text
-    from datetime import datetime
-    from tests.infrastructure.schemas.user import UserCreateSpec
-    
-    # Create a user in the database first
-    db_session.execute(
-        text("""
-            INSERT INTO users (email, username, is_active, created_at, updated_at)
-            VALUES (:email, :username, :is_active, :created_at, :updated_at)
-        """),
-        {
-            "email": "user1@example.com",
-            "username": "existing_username",
-            "is_active": True,
-            "created_at": datetime.now(),
-            "updated_at": None
-        }
-    )
-    db_session.commit()
-    
-    # Try to create another user with the same username
-    user_data = UserCreateSpec(
-        email="user2@example.com",
-        username="existing_username",
-        is_active=True
-    )
+    ).model_dump()
+    user_data[field] = value
     
-    response = await client.post("/users", json=user_data.model_dump())
+    response = await client.post("/users", json=user_data)
     
     assert response.status_code == 409
     data = response.json()
@@ -283,16 +253,25 @@ async def test_create_user_duplicate_username(client: AsyncClient, db_session):
 
 
 @pytest.mark.asyncio
-async def test_create_user_invalid_email_format(client: AsyncClient):
+@pytest.mark.parametrize(
+    "email",
+    [
+        "invalid-email",
+        "user@",
+        "@example.com",
+        "user@@example.com",
+        "user name@example.com",
+    ],
+    ids=["no-at", "no-domain", "no-local-part", "double-at", "space"],
+)
+async def test_create_user_invalid_email_format(client: AsyncClient, email):
     """
     Test POST /users returns 422 when email format is invalid.
     
     RED phase: This test will fail because the endpoint doesn't exist yet.
     """
-    from tests.infrastructure.schemas.user import UserCreateSpec
-    
     user_data = {
-        "email": "invalid-email",
+        "email": email,
         "username": "testuser",
         "is_active": True
     }
@@ -304,22 +283,6 @@ async def test_create_user_invalid_email_format(client: AsyncClient):
     assert "detail" in data
 
 
-@pytest.mark.asyncio
-async def test_create_user_missing_required_fields(client: AsyncClient):
-    """
-    Test POST /users returns 422 when required fields are missing.
-    
-    RED phase: This test will fail because the endpoint doesn't exist yet.
-    """
-    # Missing email
-    response = await client.post("/users", json={"username": "testuser"})
-    assert response.status_code == 422
-    
-    # Missing username
-    response = await client.post("/users", json={"email": "test@example.com"})
-    assert response.status_code == 422
-
-
 # ==================== PUT /users/{id} (UPDATE) Tests ====================
 
 @pytest.mark.asyncio
@@ -329,27 +292,9 @@ async def test_update_user_success(client: AsyncClient, db_session):
     
     RED phase: This test will fail because the endpoint doesn't exist yet.
     """
-    from sqlalchemy import text
-    from datetime import datetime
-    from tests.infrastructure.schemas.user import UserUpdateSpec
-    
     # Create a user in the database first
-    result = db_session.execute(
-        text("""
-            INSERT INTO users (email, username, is_active, created_at, updated_at)
-            VALUES (:email, :username, :is_active, :created_at, :updated_at)
-            RETURNING id
-        """),
-        {
-            "email": "original@example.com",
-            "username": "originaluser",
-            "is_active": True,
-            "created_at": datetime.now(),
-            "updated_at": None
-        }
-    )
-    user_id = result.scalar()
-    db_session.commit()
+    user_id = _make_user(db_session, email="original@example.com", username="originaluser")
+    db_session.flush()
     
     # Update the user
     update_data = UserUpdateSpec(
@@ -363,13 +308,9 @@ async def test_update_user_success(client: AsyncClient, db_session):
     assert response.status_code == 200
     data = response.json()
     
-    # Validate response matches UserSpec
-    user = UserSpec(**data)
-    assert user.id == user_id
-    assert user.email == "updated@example.com"
-    assert user.username == "updateduser"
-    assert user.is_active is False
-    assert user.updated_at is not None
+    # Validate returned fields (schema contract is checked in test_get_user_by_id_success)
+    _expect(data, id=user_id, email="updated@example.com", username="updateduser", is_active=False)
+    assert data["updated_at"] is not None
 
 
 @pytest.mark.asyncio
@@ -379,27 +320,9 @@ async def test_update_user_partial(client: AsyncClient, db_session):
     
     RED phase: This test will fail because the endpoint doesn't exist yet.
     """
-    from sqlalchemy import text
-    from datetime import datetime
-    from tests.infrastructure.schemas.user import UserUpdateSpec
-    
     # Create a user in the database first
-    result = db_session.execute(
-        text("""
-            INSERT INTO users (email, username, is_active, created_at, updated_at)
-            VALUES (:email, :username, :is_active, :created_at, :updated_at)
-            RETURNING id
-        """),
-        {
-            "email": "partial@example.com",
-            "username": "partialuser",
-            "is_active": True,
-            "created_at": datetime.now(),
-            "updated_at": None
-        }
-    )
-    user_id = result.scalar()
-    db_session.commit()
+    user_id = _make_user(db_session, email="partial@example.com", username="partialuser")
+    db_session.flush()
     
     # Update only email
     update_data = UserUpdateSpec(email="newemail@example.com")
@@ -409,12 +332,8 @@ async def test_update_user_partial(client: AsyncClient, db_session):
     assert response.status_code == 200
     data = response.json()
     
-    # Validate response
-    user = UserSpec(**data)
-    assert user.id == user_id
-    assert user.email == "newemail@example.com"
-    assert user.username == "partialuser"  # Should remain unchanged
-    assert user.is_active is True  # Should remain unchanged
+    # Validate response; username and is_active should remain unchanged
+    _expect(data, id=user_id, email="newemail@example.com", username="partialuser", is_active=True)
 
 
 @pytest.mark.asyncio
@@ -424,8 +343,6 @@ async def test_update_user_not_found(client: AsyncClient):
     
     RED phase: This test will fail because the endpoint doesn't exist yet.
     """
-    from tests.infrastructure.schemas.user import UserUpdateSpec
-    
     update_data = UserUpdateSpec(email="test@example.com")
     
     response = await client.put("/users/999", json=update_data.model_dump(exclude_none=True))
@@ -436,49 +353,18 @@ async def test_update_user_not_found(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_update_user_duplicate_email(client: AsyncClient, db_session):
+async def test_update_user_duplicate_email(client: AsyncClient, db_session, make_users):
     """
     Test PUT /users/{id} returns 409 when new email already exists.
     
     RED phase: This test will fail because the endpoint doesn't exist yet.
     """
-    from sqlalchemy import text
-    from datetime import datetime
-    from tests.infrastructure.schemas.user import UserUpdateSpec
-    
-    # Create two users
-    result1 = db_session.execute(
-        text("""
-            INSERT INTO users (email, username, is_active, created_at, updated_at)
-            VALUES (:email, :username, :is_active, :created_at, :updated_at)
-            RETURNING id
-        """),
-        {
-            "email": "user1@example.com",
-            "username": "user1",
-            "is_active": True,
-            "created_at": datetime.now(),
-            "updated_at": None
-        }
-    )
-    user1_id = result1.scalar()
-    
-    result2 = db_session.execute(
-        text("""
-            INSERT INTO users (email, username, is_active, created_at, updated_at)
-            VALUES (:email, :username, :is_active, :created_at, :updated_at)
-            RETURNING id
-        """),
-        {
-            "email": "user2@example.com",
-            "username": "user2",
-            "is_active": True,
-            "created_at": datetime.now(),
-            "updated_at": None
-        }
-    )
-    user2_id = result2.scalar()
-    db_session.commit()
+    # Create two users in a single bulk insert
+    user1_id, user2_id = make_users([
+        {"email": "user1@example.com", "username": "user1"},
+        {"email": "user2@example.com", "username": "user2"},
+    ])
+    db_session.flush()
     
     # Try to update user2 with user1's email
     update_data = UserUpdateSpec(email="user1@example.com")
@@ -499,26 +385,9 @@ async def test_delete_user_success(client: AsyncClient, db_session):
     
     RED phase: This test will fail because the endpoint doesn't exist yet.
     """
-    from sqlalchemy import text
-    from datetime import datetime
-    
     # Create a user in the database first
-    result = db_session.execute(
-        text("""
-            INSERT INTO users (email, username, is_active, created_at, updated_at)
-            VALUES (:email, :username, :is_active, :created_at, :updated_at)
-            RETURNING id
-        """),
-        {
-            "email": "todelete@example.com",
-            "username": "todelete",
-            "is_active": True,
-            "created_at": datetime.now(),
-            "updated_at": None
-        }
-    )
-    user_id = result.scalar()
-    db_session.commit()
+    user_id = _make_user(db_session, email="todelete@example.com", username="todelete")
+    db_session.flush()
     
     # Delete the user
     response = await client.delete(f"/users/{user_id}")
@@ -530,30 +399,40 @@ async def test_delete_user_success(client: AsyncClient, db_session):
     assert get_response.status_code == 404
 
 
-@pytest.mark.asyncio
-async def test_delete_user_not_found(client: AsyncClient):
-    """
-    Test DELETE /users/{id} returns 404 when user doesn't exist.
-    
-    RED phase: This test will fail because the endpoint doesn't exist yet.
-    """
-    response = await client.delete("/users/999")
-    
-    assert response.status_code == 404
-    data = response.json()
-    assert "detail" in data
-
+# ==================== Error path Tests ====================
 
 @pytest.mark.asyncio
-async def test_delete_user_invalid_id_format(client: AsyncClient):
-    """
-    Test DELETE /users/{id} returns 422 when ID is not a valid integer.
-    
-    RED phase: This test will fail because the endpoint doesn't exist yet.
-    """
-    response = await client.delete("/users/invalid-id")
-    
-    assert response.status_code == 422
+@pytest.mark.parametrize(
+    "method,path,body,status",
+    [
+        ("GET", "/users/999", None, 404),
+        ("GET", "/users/invalid-id", None, 422),
+        ("DELETE", "/users/999", None, 404),
+        ("DELETE", "/users/invalid-id", None, 422),
+        ("POST", "/users", {"username": "testuser"}, 422),  # Missing email
+        ("POST", "/users", {"email": "test@example.com"}, 422),  # Missing username
+    ],
+    ids=[
+        "get-not-found",
+        "get-invalid-id",
+        "delete-not-found",
+        "delete-invalid-id",
+        "create-missing-email",
+        "create-missing-username",
+    ],
+)
+async def test_user_error_paths(client: AsyncClient, method, path, body, status):
+    """
+    Test /users error responses that need no rows seeded by the test.
+    
+    Covers 404 for unknown ids, 422 for non-integer ids and 422 for
+    POST bodies missing required fields.
+    """
+    if method == "GET":
+        response = await client.get(path)
+    else:
+        response = await client.request(method, path, json=body)
+    
+    assert response.status_code == status
     data = response.json()
     assert "detail" in data
-
@@ -1,12 +1,20 @@
 """
 Configuration file for load testing with Locust
 """
-from locust import HttpUser, task, between
+from locust import FastHttpUser, task, constant_pacing
 
 
-class FastAPIUser(HttpUser):
-    """Simulated user for load testing"""
-    wait_time = between(1, 3)  # Wait between 1 and 3 seconds between requests
+class FastAPIUser(FastHttpUser):
+    """
+    Simulated user for load testing.
+    
+    FastHttpUser (geventhttpclient, keep-alive connections) generates far
+    more requests per Locust worker than HttpUser, so the load generator
+    doesn't saturate before the app does.
+    """
+    wait_time = constant_pacing(0.1)  # One task every 0.1 seconds per user
+    network_timeout = 10.0
+    connection_timeout = 2.0
     
     @task
     def hello_world(self):
@@ -4,201 +4,149 @@ Following TDD: tests are written first, implementation comes later.
 
 These tests verify that the HTTP repository makes correct API calls.
 """
+import httpx
+import orjson
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+from typing import List
 from httpx import HTTPStatusError
 
+from app.infrastructure.nasa.http_repository import NASAHTTPRepository
 from app.schemas.nasa import (
-    APOD, NeoFeed, DonkiNotification, InsightWeather, TechTransferPatents
+    APOD, NeoFeed, DonkiNotification, InsightWeather, TechTransferPatents, TechTransferPatent
 )
-from tests.infrastructure.external_apis.nasa.mock import NASAMock
 
 
-@pytest.fixture
-def nasa_mock():
-    """Fixture that provides NASAMock instance for loading payloads"""
-    return NASAMock()
-
+_JSON_HEADERS = {"content-type": "application/json"}
 
-@pytest.fixture
-def mock_http_client():
-    """Fixture that mocks httpx.AsyncClient"""
-    with patch('httpx.AsyncClient') as mock_client_class:
-        mock_client = AsyncMock()
-        mock_context_manager = AsyncMock()
-        mock_context_manager.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_context_manager.__aexit__ = AsyncMock(return_value=None)
-        mock_client_class.return_value = mock_context_manager
-        yield mock_client
 
-
-@pytest.mark.asyncio
-async def test_http_repository_get_apod(mock_http_client, nasa_mock):
+@pytest.fixture(scope="module")
+def _nasa_api_transport(nasa_mock):
     """
-    Test that NASAHTTPRepository correctly calls APOD endpoint.
-    TDD: Repository doesn't exist yet, this will fail initially.
-    """
-    from app.infrastructure.nasa.http_repository import NASAHTTPRepository
-    
-    # Setup mock response
-    apod_data = nasa_mock.get_apod()
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json = MagicMock(return_value=apod_data)
-    mock_response.raise_for_status = MagicMock()
-    mock_http_client.get = AsyncMock(return_value=mock_response)
+    Module-scoped httpx.MockTransport serving the NASA API from payloads.
     
-    # Execute
-    repository = NASAHTTPRepository(base_url="https://api.nasa.gov", api_key="test_key")
-    result = await repository.get_apod(date="2020-01-01", hd=False)
+    Requests go through real httpx request/response handling; only the
+    network is replaced. Every request is recorded so tests can check the
+    URL and query parameters the repository sent.
     
-    # Verify result
-    assert isinstance(result, APOD)
-    assert result.date == apod_data["date"]
-    assert result.title == apod_data["title"]
-    
-    # Verify HTTP call
-    mock_http_client.get.assert_called_once()
-    call_args = mock_http_client.get.call_args
-    assert "/planetary/apod" in call_args[0][0]
-    assert call_args[1]["params"]["api_key"] == "test_key"
-    assert call_args[1]["params"]["date"] == "2020-01-01"
-    # hd=False should not be included in params (only include if True)
-    assert "hd" not in call_args[1]["params"]
-
-
-@pytest.mark.asyncio
-async def test_http_repository_get_neo_feed(mock_http_client, nasa_mock):
-    """
-    Test that NASAHTTPRepository correctly calls NEO Feed endpoint.
-    TDD: Repository doesn't exist yet, this will fail initially.
+    Yields:
+        Tuple of (MockTransport, list of recorded httpx.Request)
     """
-    from app.infrastructure.nasa.http_repository import NASAHTTPRepository
-    
-    neo_data = nasa_mock.get_neo_feed("2015-09-07")
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json = MagicMock(return_value=neo_data)
-    mock_response.raise_for_status = MagicMock()
-    mock_http_client.get = AsyncMock(return_value=mock_response)
-    
-    repository = NASAHTTPRepository(base_url="https://api.nasa.gov", api_key="test_key")
-    result = await repository.get_neo_feed(start_date="2015-09-07", end_date="2015-09-08")
-    
-    assert isinstance(result, NeoFeed)
-    assert result.element_count == neo_data["element_count"]
-    
-    call_args = mock_http_client.get.call_args
-    assert "/neo/rest/v1/feed" in call_args[0][0]
-    assert call_args[1]["params"]["start_date"] == "2015-09-07"
-    assert call_args[1]["params"]["end_date"] == "2015-09-08"
+    requests: List[httpx.Request] = []
+    # Response bodies by URL path, loaded and encoded once per module
+    payloads = {
+        "/planetary/apod": nasa_mock.get_apod(),
+        "/neo/rest/v1/feed": nasa_mock.get_neo_feed("2015-09-07"),
+        "/DONKI/notifications": nasa_mock.get_donki_notifications(),
+        "/insight_weather/": nasa_mock.get_insight_weather(),
+        "/techtransfer/patent/": nasa_mock.get_techtransfer_patents(),
+    }
+    bodies = {path: orjson.dumps(payload) for path, payload in payloads.items()}
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        body = bodies.get(request.url.path)
+        if body is None:
+            raise AssertionError(f"NASA API mock has no payload for {request.url.path}")
+        return httpx.Response(200, content=body, headers=_JSON_HEADERS)
+    
+    yield httpx.MockTransport(handler), requests
 
 
-@pytest.mark.asyncio
-async def test_http_repository_get_donki_notifications(mock_http_client, nasa_mock):
-    """
-    Test that NASAHTTPRepository correctly calls DONKI Notifications endpoint.
-    TDD: Repository doesn't exist yet, this will fail initially.
-    """
-    from app.infrastructure.nasa.http_repository import NASAHTTPRepository
-    
-    donki_data = nasa_mock.get_donki_notifications()
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json = MagicMock(return_value=donki_data)
-    mock_response.raise_for_status = MagicMock()
-    mock_http_client.get = AsyncMock(return_value=mock_response)
-    
-    repository = NASAHTTPRepository(base_url="https://api.nasa.gov", api_key="test_key")
-    result = await repository.get_donki_notifications(
-        start_date="2019-08-06",
-        notification_type="FLR"
-    )
-    
-    assert isinstance(result, list)
-    assert len(result) > 0
-    assert isinstance(result[0], DonkiNotification)
-    
-    call_args = mock_http_client.get.call_args
-    assert "/DONKI/notifications" in call_args[0][0]
-    assert call_args[1]["params"]["startDate"] == "2019-08-06"
-    assert call_args[1]["params"]["type"] == "FLR"
+@pytest.fixture
+def nasa_api_requests(_nasa_api_transport) -> List[httpx.Request]:
+    """Requests sent to the mocked NASA API during the current test."""
+    _, requests = _nasa_api_transport
+    requests.clear()
+    return requests
 
 
-@pytest.mark.asyncio
-async def test_http_repository_get_insight_weather(mock_http_client, nasa_mock):
-    """
-    Test that NASAHTTPRepository correctly calls InSight Weather endpoint.
-    TDD: Repository doesn't exist yet, this will fail initially.
-    """
-    from app.infrastructure.nasa.http_repository import NASAHTTPRepository
-    
-    weather_data = nasa_mock.get_insight_weather()
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json = MagicMock(return_value=weather_data)
-    mock_response.raise_for_status = MagicMock()
-    mock_http_client.get = AsyncMock(return_value=mock_response)
-    
-    repository = NASAHTTPRepository(base_url="https://api.nasa.gov", api_key="test_key")
-    result = await repository.get_insight_weather(feedtype="json", ver="1.0")
-    
-    assert isinstance(result, InsightWeather)
-    assert result.sol_keys is not None
-    
-    call_args = mock_http_client.get.call_args
-    assert "/insight_weather/" in call_args[0][0]
-    assert call_args[1]["params"]["feedtype"] == "json"
-    assert call_args[1]["params"]["ver"] == "1.0"
+@pytest.fixture
+def repository(_nasa_api_transport, nasa_api_requests):
+    """NASAHTTPRepository wired to the mocked NASA API transport."""
+    transport, _ = _nasa_api_transport
+    return NASAHTTPRepository(base_url="https://api.nasa.gov", api_key="test_key", transport=transport)
+
+
+# (repository method, call kwargs, expected URL path, expected query params
+#  besides api_key, builds the expected result from NASAMock payloads)
+_ENDPOINT_CASES = [
+    pytest.param(
+        "get_apod",
+        # hd=False should not be included in params (only include if True)
+        {"date": "2020-01-01", "hd": False},
+        "/planetary/apod",
+        {"date": "2020-01-01"},
+        lambda mock: APOD(**mock.get_apod()),
+        id="apod",
+    ),
+    pytest.param(
+        "get_neo_feed",
+        {"start_date": "2015-09-07", "end_date": "2015-09-08"},
+        "/neo/rest/v1/feed",
+        {"start_date": "2015-09-07", "end_date": "2015-09-08"},
+        lambda mock: NeoFeed(**mock.get_neo_feed("2015-09-07")),
+        id="neo_feed",
+    ),
+    pytest.param(
+        "get_donki_notifications",
+        {"start_date": "2019-08-06", "notification_type": "FLR"},
+        "/DONKI/notifications",
+        {"startDate": "2019-08-06", "type": "FLR"},
+        lambda mock: [DonkiNotification(**n) for n in mock.get_donki_notifications()],
+        id="donki_notifications",
+    ),
+    pytest.param(
+        "get_insight_weather",
+        {"feedtype": "json", "ver": "1.0"},
+        "/insight_weather/",
+        {"feedtype": "json", "ver": "1.0"},
+        lambda mock: InsightWeather(**mock.get_insight_weather()),
+        id="insight_weather",
+    ),
+    pytest.param(
+        "get_techtransfer_patents",
+        {"query": "solar", "limit": 10},
+        "/techtransfer/patent/",
+        # Query parameters are sent as strings
+        {"query": "solar", "limit": "10"},
+        lambda mock: TechTransferPatents(
+            results=[TechTransferPatent(**p) for p in mock.get_techtransfer_patents()["results"]]
+        ),
+        id="techtransfer_patents",
+    ),
+]
 
 
 @pytest.mark.asyncio
-async def test_http_repository_get_techtransfer_patents(mock_http_client, nasa_mock):
+@pytest.mark.parametrize("method_name,kwargs,path,expected_params,build_expected", _ENDPOINT_CASES)
+async def test_http_repository_endpoints(
+    repository, nasa_api_requests, nasa_mock, method_name, kwargs, path, expected_params, build_expected
+):
     """
-    Test that NASAHTTPRepository correctly calls Tech Transfer Patents endpoint.
-    TDD: Repository doesn't exist yet, this will fail initially.
+    Test that NASAHTTPRepository calls each endpoint correctly and parses the payload.
     """
-    from app.infrastructure.nasa.http_repository import NASAHTTPRepository
+    result = await getattr(repository, method_name)(**kwargs)
     
-    patents_data = nasa_mock.get_techtransfer_patents()
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json = MagicMock(return_value=patents_data)
-    mock_response.raise_for_status = MagicMock()
-    mock_http_client.get = AsyncMock(return_value=mock_response)
+    # Verify result (parsed into the schema, same data as the payload)
+    expected = build_expected(nasa_mock)
+    assert result == expected
     
-    repository = NASAHTTPRepository(base_url="https://api.nasa.gov", api_key="test_key")
-    result = await repository.get_techtransfer_patents(query="solar", limit=10)
-    
-    assert isinstance(result, TechTransferPatents)
-    assert len(result.results) > 0
-    
-    call_args = mock_http_client.get.call_args
-    assert "/techtransfer/patent/" in call_args[0][0]
-    assert call_args[1]["params"]["query"] == "solar"
-    assert call_args[1]["params"]["limit"] == 10
+    # Verify HTTP call: one request, right path, exactly the expected params
+    assert len(nasa_api_requests) == 1
+    request = nasa_api_requests[0]
+    assert request.url.path == path
+    assert dict(request.url.params) == {"api_key": "test_key", **expected_params}
 
 
 @pytest.mark.asyncio
-async def test_http_repository_handles_errors(mock_http_client):
+async def test_http_repository_handles_errors(nasa_mock):
     """Test that NASAHTTPRepository properly handles HTTP errors."""
-    from app.infrastructure.nasa.http_repository import NASAHTTPRepository
+    error_data = nasa_mock.get_apod_error()
+    transport = httpx.MockTransport(lambda request: httpx.Response(400, json=error_data))
     
-    mock_response = MagicMock()
-    mock_response.status_code = 400
-    mock_response.raise_for_status = MagicMock(
-        side_effect=HTTPStatusError(
-            "400 Bad Request",
-            request=MagicMock(),
-            response=MagicMock(status_code=400)
-        )
-    )
-    mock_http_client.get = AsyncMock(return_value=mock_response)
-    
-    repository = NASAHTTPRepository(base_url="https://api.nasa.gov", api_key="test_key")
+    repository = NASAHTTPRepository(base_url="https://api.nasa.gov", api_key="test_key", transport=transport)
     
     with pytest.raises(HTTPStatusError) as exc_info:
         await repository.get_apod()
     
     assert exc_info.value.response.status_code == 400
-
@@ -5,74 +5,90 @@ Following TDD: tests are written first, implementation comes later.
 These tests mock the external NASA API using the NASA mock infrastructure
 to ensure consistent test data.
 """
+import httpx
+import orjson
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+from typing import List
 from httpx import HTTPStatusError
 
+from app.services.nasa_service import NASAService
 from app.schemas.nasa import APOD
-from tests.infrastructure.external_apis.nasa.mock import NASAMock
 
 
-@pytest.fixture
-def nasa_mock():
-    """Fixture that provides NASAMock instance for loading payloads"""
-    return NASAMock()
+_JSON_HEADERS = {"content-type": "application/json"}
+
+
+def _assert_apod_request(requests: List[httpx.Request], **expected_params: str) -> None:
+    """
+    Assert the service sent exactly one APOD request with the given query params.
+    
+    Args:
+        requests: Requests recorded by the mocked NASA API
+        **expected_params: Expected query parameter values (as sent, i.e. strings)
+    """
+    assert len(requests) == 1
+    url = requests[0].url
+    assert url.path == "/planetary/apod"
+    for name, value in expected_params.items():
+        assert url.params.get(name) == value, name
+
+
+@pytest.fixture(scope="module")
+def _nasa_api_transport(nasa_mock):
+    """
+    Module-scoped httpx.MockTransport serving the NASA APOD endpoint from payloads.
+    
+    Built once per module; every request is recorded so tests can check the
+    URL and query parameters the service sent. Paths missing from the
+    bodies dict get the 400 error payload, so a test can drop an entry
+    (monkeypatch.delitem) to exercise the error path.
+    
+    Yields:
+        Tuple of (MockTransport, list of recorded httpx.Request, bodies by path)
+    """
+    requests: List[httpx.Request] = []
+    # Response bodies by URL path, loaded and encoded once per module
+    bodies = {
+        "/planetary/apod": orjson.dumps(nasa_mock.get_apod()),
+    }
+    error_body = orjson.dumps(nasa_mock.get_apod_error())
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        body = bodies.get(request.url.path)
+        if body is None:
+            # Unknown endpoint
+            return httpx.Response(400, content=error_body, headers=_JSON_HEADERS)
+        return httpx.Response(200, content=body, headers=_JSON_HEADERS)
+    
+    yield httpx.MockTransport(handler), requests, bodies
 
 
 @pytest.fixture
-def mock_nasa_api(nasa_mock):
+def mock_nasa_api(_nasa_api_transport) -> List[httpx.Request]:
     """
     Fixture that mocks the external NASA API.
     Returns mock responses based on payloads loaded from infrastructure/external_apis/nasa/payloads/
+    
+    Returns the requests sent to the mocked API during the current test.
     """
-    # Patch httpx.AsyncClient directly since nasa_service doesn't exist yet (TDD)
-    with patch('httpx.AsyncClient') as mock_client_class:
-        mock_client = AsyncMock()
-        mock_context_manager = AsyncMock()
-        mock_context_manager.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_context_manager.__aexit__ = AsyncMock(return_value=None)
-        mock_client_class.return_value = mock_context_manager
-        
-        # Configure mock responses based on payloads
-        async def mock_get(url, **kwargs):
-            mock_response = MagicMock()
-            
-            if "/planetary/apod" in url:
-                # GET APOD
-                data = nasa_mock.get_apod()
-                mock_response.status_code = 200
-                mock_response.json = MagicMock(return_value=data)
-                mock_response.raise_for_status = MagicMock()
-            else:
-                # Unknown endpoint
-                error_data = nasa_mock.get_apod_error()
-                mock_response.status_code = 400
-                mock_response.json = MagicMock(return_value=error_data)
-                mock_response.raise_for_status = MagicMock(
-                    side_effect=HTTPStatusError(
-                        "400 Bad Request",
-                        request=MagicMock(),
-                        response=MagicMock(status_code=400)
-                    )
-                )
-            
-            return mock_response
-        
-        mock_client.get = AsyncMock(side_effect=mock_get)
-        
-        yield mock_client
+    _, requests, _ = _nasa_api_transport
+    requests.clear()
+    return requests
+
+
+@pytest.fixture
+def service(_nasa_api_transport, mock_nasa_api):
+    """NASAService wired to the mocked NASA API transport."""
+    transport, _, _ = _nasa_api_transport
+    return NASAService(base_url="https://api.nasa.gov", api_key="test_key", transport=transport)
 
 
 @pytest.mark.asyncio
-async def test_get_apod_success(mock_nasa_api, nasa_mock):
+async def test_get_apod_success(service, mock_nasa_api, nasa_mock):
     """
     Test that NASAService can successfully retrieve APOD data.
-    
-    This test follows TDD - the service doesn't exist yet, so this will fail initially.
     """
-    from app.services.nasa_service import NASAService
-    
-    service = NASAService(base_url="https://api.nasa.gov", api_key="test_key")
     apod = await service.get_apod()
     
     # Verify the response is an APOD object
@@ -88,20 +104,14 @@ async def test_get_apod_success(mock_nasa_api, nasa_mock):
     assert str(apod.url) == expected_data["url"]
     
     # Verify the API was called correctly
-    mock_nasa_api.get.assert_called_once()
-    call_args = mock_nasa_api.get.call_args
-    assert "/planetary/apod" in call_args[0][0]
-    assert "api_key" in call_args[1]["params"]
+    _assert_apod_request(mock_nasa_api, api_key="test_key")
 
 
 @pytest.mark.asyncio
-async def test_get_apod_with_date_parameter(mock_nasa_api, nasa_mock):
+async def test_get_apod_with_date_parameter(service, mock_nasa_api):
     """
     Test that NASAService can retrieve APOD for a specific date.
     """
-    from app.services.nasa_service import NASAService
-    
-    service = NASAService(base_url="https://api.nasa.gov", api_key="test_key")
     test_date = "2020-01-01"
     apod = await service.get_apod(date=test_date)
     
@@ -110,61 +120,36 @@ async def test_get_apod_with_date_parameter(mock_nasa_api, nasa_mock):
     assert apod.date == test_date
     
     # Verify the date parameter was passed to the API
-    mock_nasa_api.get.assert_called_once()
-    call_args = mock_nasa_api.get.call_args
-    assert "date" in call_args[1]["params"]
-    assert call_args[1]["params"]["date"] == test_date
+    _assert_apod_request(mock_nasa_api, date=test_date)
 
 
 @pytest.mark.asyncio
-async def test_get_apod_with_hd_parameter(mock_nasa_api, nasa_mock):
+async def test_get_apod_with_hd_parameter(service, mock_nasa_api):
     """
     Test that NASAService can request HD image URL.
     """
-    from app.services.nasa_service import NASAService
-    
-    service = NASAService(base_url="https://api.nasa.gov", api_key="test_key")
     apod = await service.get_apod(hd=True)
     
     # Verify the response is an APOD object
     assert isinstance(apod, APOD)
     
-    # Verify the hd parameter was passed to the API
-    mock_nasa_api.get.assert_called_once()
-    call_args = mock_nasa_api.get.call_args
-    assert "hd" in call_args[1]["params"]
-    assert call_args[1]["params"]["hd"] is True
+    # Verify the hd parameter was passed to the API (httpx encodes True as "true")
+    _assert_apod_request(mock_nasa_api, hd="true")
 
 
 @pytest.mark.asyncio
-async def test_get_apod_api_error(mock_nasa_api, nasa_mock):
+async def test_get_apod_api_error(service, mock_nasa_api, _nasa_api_transport, nasa_mock, monkeypatch):
     """
     Test that NASAService properly handles API errors (400 Bad Request).
     """
-    from app.services.nasa_service import NASAService
-    
-    # Configure mock to return error
-    async def mock_get_error(url, **kwargs):
-        mock_response = MagicMock()
-        error_data = nasa_mock.get_apod_error()
-        mock_response.status_code = 400
-        mock_response.json = MagicMock(return_value=error_data)
-        mock_response.raise_for_status = MagicMock(
-            side_effect=HTTPStatusError(
-                "400 Bad Request",
-                request=MagicMock(),
-                response=MagicMock(status_code=400)
-            )
-        )
-        return mock_response
-    
-    mock_nasa_api.get = AsyncMock(side_effect=mock_get_error)
-    
-    service = NASAService(base_url="https://api.nasa.gov", api_key="test_key")
+    # Configure mock to return error: without an APOD body it answers 400
+    _, _, bodies = _nasa_api_transport
+    monkeypatch.delitem(bodies, "/planetary/apod")
     
     # Verify that HTTPStatusError is raised
     with pytest.raises(HTTPStatusError) as exc_info:
         await service.get_apod()
     
     assert exc_info.value.response.status_code == 400
-
+    assert exc_info.value.response.json() == nasa_mock.get_apod_error()
+    _assert_apod_request(mock_nasa_api)
@@ -5,221 +5,192 @@ Following TDD: tests are written first, implementation comes later.
 These tests verify the business logic in use cases, independent of HTTP implementation.
 """
 import pytest
-from unittest.mock import Mock, AsyncMock
-from typing import Optional
-
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.application.nasa.use_cases import (
+    GetAPODUseCase,
+    GetDonkiNotificationsUseCase,
+    GetInsightWeatherUseCase,
+    GetNeoFeedUseCase,
+    GetTechTransferPatentsUseCase,
+)
+from app.domain.nasa.repositories import NASARepository
 from app.schemas.nasa import (
-    APOD, NeoFeed, DonkiNotification, InsightWeather, TechTransferPatents
+    APOD, NeoFeed, DonkiNotification, InsightWeather, TechTransferPatents, TechTransferPatent
 )
 
 
-# Tests for GetAPODUseCase
-@pytest.mark.asyncio
-async def test_get_apod_use_case_success():
-    """
-    Test that GetAPODUseCase successfully retrieves APOD data.
-    TDD: Use case doesn't exist yet, this will fail initially.
-    """
-    from app.application.nasa.use_cases import GetAPODUseCase
-    from app.domain.nasa.repositories import NASARepository
-    
-    # Mock repository
-    mock_repository = Mock(spec=NASARepository)
-    expected_apod = APOD(
-        date="2020-01-01",
-        explanation="Test explanation",
-        title="Test Title",
-        media_type="image",
-        service_version="v1",
-        url="https://example.com/image.jpg"
+# Canned repository results, validated once per process and shared by the
+# tests below (use cases pass them through; tests never mutate them)
+_APOD_SAMPLE = APOD(
+    date="2020-01-01",
+    explanation="Test explanation",
+    title="Test Title",
+    media_type="image",
+    service_version="v1",
+    url="https://example.com/image.jpg"
+)
+_NEO_FEED_SAMPLE = NeoFeed(
+    links={"self": "https://example.com"},
+    element_count=12,
+    near_earth_objects={"2015-09-07": []}
+)
+_DONKI_NOTIFICATIONS_SAMPLE = [
+    DonkiNotification(
+        messageType="FLR",
+        messageID="2019-08-06T00:00:00-FLR-001",
+        messageURL="https://example.com",
+        messageIssueTime="2019-08-06T00:00:00Z",
+        messageBody="Test message"
     )
-    mock_repository.get_apod = AsyncMock(return_value=expected_apod)
-    
-    # Execute use case
-    use_case = GetAPODUseCase(repository=mock_repository)
-    result = await use_case.execute(date="2020-01-01", hd=False)
-    
-    # Verify result
-    assert isinstance(result, APOD)
-    assert result.date == "2020-01-01"
-    assert result.title == "Test Title"
-    
-    # Verify repository was called correctly
-    mock_repository.get_apod.assert_called_once_with(date="2020-01-01", hd=False)
-
-
-@pytest.mark.asyncio
-async def test_get_apod_use_case_with_hd():
-    """Test that GetAPODUseCase passes hd parameter correctly."""
-    from app.application.nasa.use_cases import GetAPODUseCase
-    from app.domain.nasa.repositories import NASARepository
-    
-    mock_repository = Mock(spec=NASARepository)
-    mock_repository.get_apod = AsyncMock(return_value=APOD(
-        date="2020-01-01",
-        explanation="Test",
-        title="Test",
-        media_type="image",
-        service_version="v1",
-        url="https://example.com/image.jpg"
-    ))
-    
-    use_case = GetAPODUseCase(repository=mock_repository)
-    await use_case.execute(hd=True)
-    
-    mock_repository.get_apod.assert_called_once_with(date=None, hd=True)
+]
+_INSIGHT_WEATHER_SAMPLE = InsightWeather(
+    sol_keys=["675", "676"],
+    validity_checks={},
+    description={}
+)
+_TECHTRANSFER_PATENTS_SAMPLE = TechTransferPatents(
+    results=[
+        TechTransferPatent(
+            id=1,
+            title="Test Patent",
+            abstract="Test abstract",
+            patentNumber="US12345678",
+            expirationDate="2035-12-31",
+            applicationDate="2010-01-15"
+        )
+    ]
+)
 
 
-# Tests for GetNeoFeedUseCase
-@pytest.mark.asyncio
-async def test_get_neo_feed_use_case_success():
-    """
-    Test that GetNeoFeedUseCase successfully retrieves NEO feed data.
-    TDD: Use case doesn't exist yet, this will fail initially.
+class FakeNASARepository(NASARepository):
     """
-    from app.application.nasa.use_cases import GetNeoFeedUseCase
-    from app.domain.nasa.repositories import NASARepository
-    
-    mock_repository = Mock(spec=NASARepository)
-    expected_feed = NeoFeed(
-        links={"self": "https://example.com"},
-        element_count=12,
-        near_earth_objects={"2015-09-07": []}
-    )
-    mock_repository.get_neo_feed = AsyncMock(return_value=expected_feed)
-    
-    use_case = GetNeoFeedUseCase(repository=mock_repository)
-    result = await use_case.execute(start_date="2015-09-07", end_date="2015-09-08")
-    
-    assert isinstance(result, NeoFeed)
-    assert result.element_count == 12
-    mock_repository.get_neo_feed.assert_called_once_with(
-        start_date="2015-09-07",
-        end_date="2015-09-08",
-        detailed=False
-    )
-
-
-@pytest.mark.asyncio
-async def test_get_neo_feed_use_case_with_detailed():
-    """Test that GetNeoFeedUseCase passes detailed parameter correctly."""
-    from app.application.nasa.use_cases import GetNeoFeedUseCase
-    from app.domain.nasa.repositories import NASARepository
+    In-memory NASARepository returning the samples above.
     
-    mock_repository = Mock(spec=NASARepository)
-    mock_repository.get_neo_feed = AsyncMock(return_value=NeoFeed(
-        links={},
-        element_count=0,
-        near_earth_objects={}
-    ))
-    
-    use_case = GetNeoFeedUseCase(repository=mock_repository)
-    await use_case.execute(start_date="2015-09-07", detailed=True)
+    Records every call as (method name, arguments) in self.calls, so tests
+    can check exactly what the use case asked for.
+    """
     
-    mock_repository.get_neo_feed.assert_called_once_with(
-        start_date="2015-09-07",
-        end_date=None,
-        detailed=True
-    )
+    def __init__(self):
+        self.calls: List[Tuple[str, Dict[str, Any]]] = []
+    
+    async def get_apod(self, date: Optional[str] = None, hd: bool = False) -> APOD:
+        self.calls.append(("get_apod", {"date": date, "hd": hd}))
+        return _APOD_SAMPLE
+    
+    async def get_neo_feed(
+        self,
+        start_date: str,
+        end_date: Optional[str] = None,
+        detailed: bool = False
+    ) -> NeoFeed:
+        self.calls.append(("get_neo_feed", {"start_date": start_date, "end_date": end_date, "detailed": detailed}))
+        return _NEO_FEED_SAMPLE
+    
+    async def get_donki_notifications(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        notification_type: Optional[str] = None
+    ) -> List[DonkiNotification]:
+        self.calls.append((
+            "get_donki_notifications",
+            {"start_date": start_date, "end_date": end_date, "notification_type": notification_type},
+        ))
+        return _DONKI_NOTIFICATIONS_SAMPLE
+    
+    async def get_insight_weather(self, feedtype: str = "json", ver: str = "1.0") -> InsightWeather:
+        self.calls.append(("get_insight_weather", {"feedtype": feedtype, "ver": ver}))
+        return _INSIGHT_WEATHER_SAMPLE
+    
+    async def get_techtransfer_patents(self, query: Optional[str] = None, limit: int = 10) -> TechTransferPatents:
+        self.calls.append(("get_techtransfer_patents", {"query": query, "limit": limit}))
+        return _TECHTRANSFER_PATENTS_SAMPLE
+
+
+@pytest.fixture
+def fake_repository() -> FakeNASARepository:
+    """Fresh FakeNASARepository (empty call log) for each test."""
+    return FakeNASARepository()
+
+
+# (use case class, call kwargs, repository method the use case must call,
+#  its expected arguments, sample result the fake repository returns)
+_USE_CASE_CASES = [
+    pytest.param(
+        GetAPODUseCase,
+        {"date": "2020-01-01", "hd": False},
+        "get_apod",
+        {"date": "2020-01-01", "hd": False},
+        _APOD_SAMPLE,
+        id="apod",
+    ),
+    pytest.param(
+        GetNeoFeedUseCase,
+        {"start_date": "2015-09-07", "end_date": "2015-09-08"},
+        "get_neo_feed",
+        {"start_date": "2015-09-07", "end_date": "2015-09-08", "detailed": False},
+        _NEO_FEED_SAMPLE,
+        id="neo_feed",
+    ),
+    pytest.param(
+        GetDonkiNotificationsUseCase,
+        {"start_date": "2019-08-06", "end_date": "2019-08-06", "notification_type": "FLR"},
+        "get_donki_notifications",
+        {"start_date": "2019-08-06", "end_date": "2019-08-06", "notification_type": "FLR"},
+        _DONKI_NOTIFICATIONS_SAMPLE,
+        id="donki_notifications",
+    ),
+    pytest.param(
+        GetInsightWeatherUseCase,
+        {"feedtype": "json", "ver": "1.0"},
+        "get_insight_weather",
+        {"feedtype": "json", "ver": "1.0"},
+        _INSIGHT_WEATHER_SAMPLE,
+        id="insight_weather",
+    ),
+    pytest.param(
+        GetTechTransferPatentsUseCase,
+        {"query": "solar", "limit": 10},
+        "get_techtransfer_patents",
+        {"query": "solar", "limit": 10},
+        _TECHTRANSFER_PATENTS_SAMPLE,
+        id="techtransfer_patents",
+    ),
+]
 
 
-# Tests for GetDonkiNotificationsUseCase
 @pytest.mark.asyncio
-async def test_get_donki_notifications_use_case_success():
+@pytest.mark.parametrize("use_case_cls,kwargs,repo_method,repo_kwargs,sample", _USE_CASE_CASES)
+async def test_use_case_success(fake_repository, use_case_cls, kwargs, repo_method, repo_kwargs, sample):
     """
-    Test that GetDonkiNotificationsUseCase successfully retrieves DONKI notifications.
-    TDD: Use case doesn't exist yet, this will fail initially.
+    Test that each NASA use case retrieves its data through the repository.
     """
-    from app.application.nasa.use_cases import GetDonkiNotificationsUseCase
-    from app.domain.nasa.repositories import NASARepository
+    use_case = use_case_cls(repository=fake_repository)
+    result = await use_case.execute(**kwargs)
     
-    mock_repository = Mock(spec=NASARepository)
-    expected_notifications = [
-        DonkiNotification(
-            messageType="FLR",
-            messageID="2019-08-06T00:00:00-FLR-001",
-            messageURL="https://example.com",
-            messageIssueTime="2019-08-06T00:00:00Z",
-            messageBody="Test message"
-        )
-    ]
-    mock_repository.get_donki_notifications = AsyncMock(return_value=expected_notifications)
-    
-    use_case = GetDonkiNotificationsUseCase(repository=mock_repository)
-    result = await use_case.execute(
-        start_date="2019-08-06",
-        end_date="2019-08-06",
-        notification_type="FLR"
-    )
+    # Verify result (the repository's data, passed through unchanged)
+    assert result == sample
     
-    assert isinstance(result, list)
-    assert len(result) == 1
-    assert isinstance(result[0], DonkiNotification)
-    assert result[0].messageType == "FLR"
-    mock_repository.get_donki_notifications.assert_called_once_with(
-        start_date="2019-08-06",
-        end_date="2019-08-06",
-        notification_type="FLR"
-    )
+    # Verify repository was called correctly
+    assert fake_repository.calls == [(repo_method, repo_kwargs)]
 
 
-# Tests for GetInsightWeatherUseCase
 @pytest.mark.asyncio
-async def test_get_insight_weather_use_case_success():
-    """
-    Test that GetInsightWeatherUseCase successfully retrieves Mars weather data.
-    TDD: Use case doesn't exist yet, this will fail initially.
-    """
-    from app.application.nasa.use_cases import GetInsightWeatherUseCase
-    from app.domain.nasa.repositories import NASARepository
-    
-    mock_repository = Mock(spec=NASARepository)
-    expected_weather = InsightWeather(
-        sol_keys=["675", "676"],
-        validity_checks={},
-        description={}
-    )
-    mock_repository.get_insight_weather = AsyncMock(return_value=expected_weather)
-    
-    use_case = GetInsightWeatherUseCase(repository=mock_repository)
-    result = await use_case.execute(feedtype="json", ver="1.0")
+async def test_get_apod_use_case_with_hd(fake_repository):
+    """Test that GetAPODUseCase passes hd parameter correctly."""
+    use_case = GetAPODUseCase(repository=fake_repository)
+    await use_case.execute(hd=True)
     
-    assert isinstance(result, InsightWeather)
-    assert result.sol_keys == ["675", "676"]
-    mock_repository.get_insight_weather.assert_called_once_with(feedtype="json", ver="1.0")
+    assert fake_repository.calls == [("get_apod", {"date": None, "hd": True})]
 
 
-# Tests for GetTechTransferPatentsUseCase
 @pytest.mark.asyncio
-async def test_get_techtransfer_patents_use_case_success():
-    """
-    Test that GetTechTransferPatentsUseCase successfully retrieves patents.
-    TDD: Use case doesn't exist yet, this will fail initially.
-    """
-    from app.application.nasa.use_cases import GetTechTransferPatentsUseCase
-    from app.domain.nasa.repositories import NASARepository
-    
-    from app.schemas.nasa import TechTransferPatent
-    
-    mock_repository = Mock(spec=NASARepository)
-    expected_patents = TechTransferPatents(
-        results=[
-            TechTransferPatent(
-                id=1,
-                title="Test Patent",
-                abstract="Test abstract",
-                patentNumber="US12345678",
-                expirationDate="2035-12-31",
-                applicationDate="2010-01-15"
-            )
-        ]
-    )
-    mock_repository.get_techtransfer_patents = AsyncMock(return_value=expected_patents)
-    
-    use_case = GetTechTransferPatentsUseCase(repository=mock_repository)
-    result = await use_case.execute(query="solar", limit=10)
+async def test_get_neo_feed_use_case_with_detailed(fake_repository):
+    """Test that GetNeoFeedUseCase passes detailed parameter correctly."""
+    use_case = GetNeoFeedUseCase(repository=fake_repository)
+    await use_case.execute(start_date="2015-09-07", detailed=True)
     
-    assert isinstance(result, TechTransferPatents)
-    assert len(result.results) == 1
-    mock_repository.get_techtransfer_patents.assert_called_once_with(query="solar", limit=10)
-
+    assert fake_repository.calls == [
+        ("get_neo_feed", {"start_date": "2015-09-07", "end_date": None, "detailed": True})
+    ]